@@ -1,214 +1,823 @@
 from __future__ import annotations
 
 import base64
-from typing import Any, Dict, List, Optional
+import io
+import threading
+import time
+from array import array
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 from urllib.parse import quote
 
 import requests
-from requests_ntlm import HttpNtlmAuth
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+from urllib3.util.retry import Retry
 
 from .config import AzureDevOpsConfig
 
+try:
+    # Optional: pysimdjson decodes faster than the stdlib parser and can read single fields without
+    # materializing whole documents
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# A simdjson.Parser reuses its buffers between documents but must not be shared across threads
+_parsers = threading.local()
+
+
+def _simdjson_parser() -> Any:
+    parser = getattr(_parsers, "parser", None)
+    if parser is None:
+        parser = _parsers.parser = simdjson.Parser()
+    return parser
+
+
+try:
+    # Optional speedup: orjson encodes/decodes large WIQL, batch and JSON-Patch payloads several times faster
+    from orjson import dumps as _serialize, loads as _loads
+except ImportError:
+    import json as _json
+
+    def _serialize(obj: Any) -> bytes:
+        # Compact separators, matching orjson output byte for byte on typical payloads
+        return _json.dumps(obj, allow_nan=False, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    if simdjson is None:
+        from json import loads as _loads
+    else:
+
+        def _loads(data: bytes) -> Any:
+            return _simdjson_parser().parse(data, recursive=True)
+
+try:
+    # Optional: incremental parser for very large WIQL results
+    import ijson
+except ImportError:
+    ijson = None
+
 
 class AzureDevOpsError(RuntimeError):
-    pass
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        # HTTP status of the failed call, when the error came from the server
+        self.status_code = status_code
+
+
+class AzureDevOpsBatchError(AzureDevOpsError):
+    """Some entries of a `_apis/wit/$batch` call failed; the others were applied.
 
+    `results` has one item per entry in request order: the response body, or None where the entry failed.
+    `failures` maps the index of each failed entry to its (status code, error body).
+    """
+
+    def __init__(
+        self,
+        message: str,
+        results: List[Optional[Dict[str, Any]]],
+        failures: Dict[int, Tuple[int, Any]],
+    ):
+        super().__init__(message, status_code=next(iter(failures.values()))[0] if failures else None)
+        self.results = results
+        self.failures = failures
+
+
+def _decode(resp: Any) -> Any:
+    # Decode straight from the raw bytes (requests or httpx response); skips the text/encoding detection pass
+    return _loads(resp.content)
+
+
+def _decode_stream(resp: requests.Response) -> Any:
+    # For stream=True responses: read the body in one call into a single buffer instead of
+    # joining 10 KB iter_content chunks, which briefly holds two copies of a multi-MB body
+    return _loads(resp.raw.read(decode_content=True))
+
+
+# Content type for work item create/update bodies, with its header mapping built once
+_JSON_PATCH = "application/json-patch+json"
+_JSON_PATCH_HEADERS: Mapping[str, str] = MappingProxyType({"Content-Type": _JSON_PATCH})
+# JSON-Patch path prefix for work item fields, and the full paths of the fields set by name
+_FIELDS_PREFIX = "/fields/"
+_PATH_TITLE = "/fields/System.Title"
+_PATH_DESCRIPTION = "/fields/System.Description"
+_PATH_ASSIGNED_TO = "/fields/System.AssignedTo"
+_PATH_STATE = "/fields/System.State"
+_PATH_AREA = "/fields/System.AreaPath"
+_PATH_ITERATION = "/fields/System.IterationPath"
+_PATH_TAGS = "/fields/System.Tags"
+_PATH_HISTORY = "/fields/System.History"
+_PATH_RELATIONS_APPEND = "/relations/-"
+
+# Fixed query parameters shared by every call to the wiki and test endpoints (read-only, never copied)
+_WIKI_PARAMS: Mapping[str, Any] = MappingProxyType({"api-version": "7.1"})
+# Omit api-version for compatibility with some on-prem servers
+_NO_API_VERSION: Mapping[str, Any] = MappingProxyType({"api-version": None})
+_NO_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+# Error bodies are truncated to this many bytes in AzureDevOpsError messages
+_ERROR_BODY_MAX = 4096
+
+
+def _error_detail(resp: Any) -> str:
+    # Decode only the head of the body; failed calls can return multi-MB HTML error pages
+    return resp.content[:_ERROR_BODY_MAX].decode("utf-8", errors="replace")
+
+
+try:
+    # Optional speedup: libxml2-backed parsing of test steps XML. Entities, DTDs and network access are
+    # disabled, so untrusted work item XML cannot expand or fetch anything.
+    from lxml import etree as _lxml_etree
+
+    _XML_PARSER = _lxml_etree.XMLParser(resolve_entities=False, no_network=True, load_dtd=False, huge_tree=False)
+
+    def _parse_xml(text: str) -> Any:
+        # The text is already decoded, and lxml rejects str input that still carries an encoding declaration
+        if text.startswith("<?xml"):
+            text = text[text.index("?>") + 2:]
+        return _lxml_etree.fromstring(text, parser=_XML_PARSER)
+
+except ImportError:
+    import xml.etree.ElementTree as _ET
+
+    def _parse_xml(text: str) -> Any:
+        return _ET.fromstring(text)
+
+
+@lru_cache(maxsize=1024)
+def _parse_steps(steps_xml: str) -> Tuple[Tuple[str, str], ...]:
+    # The same test case steps XML is typically parsed again on every steps request for that test case
+    try:
+        # Ensure a single root element
+        text = steps_xml.strip()
+        if not text.startswith("<"):
+            return ()
+        root = _parse_xml(text)
+        steps: List[Tuple[str, str]] = []
+        # Typical structure: <steps><step> <parameterizedString>Action</paramStr> <parameterizedString>Expected</paramStr>
+        for step in root.findall('.//step'):
+            pstrs = [ps.text or "" for ps in step.findall('./parameterizedString')]
+            action = pstrs[0] if len(pstrs) >= 1 else ""
+            expected = pstrs[1] if len(pstrs) >= 2 else ""
+            steps.append((action, expected))
+        # Fallback: older schema may use <description> and <expected>
+        if not steps:
+            for step in root.findall('.//step'):
+                action = ""
+                expected = ""
+                desc = step.find('./description')
+                if desc is not None and desc.text:
+                    action = desc.text
+                exp = step.find('./expected')
+                if exp is not None and exp.text:
+                    expected = exp.text
+                if action or expected:
+                    steps.append((action, expected))
+        return tuple(steps)
+    except Exception:
+        # Parsing best-effort; on failure return no structured steps
+        return ()
+
+
+def _join_tags(tags: Sequence[str]) -> str:
+    # Strip each tag once and drop the empty ones
+    return "; ".join(filter(None, (tag.strip() for tag in tags if tag)))
+
+
+_DEFAULT_HEADERS: Dict[str, str] = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "User-Agent": "azure-devops-mcp/0.1.0",
+}
+
+
+class _HttpxAdapter(HTTPAdapter):
+    """Transport adapter that sends a session's requests through an httpx.Client (HTTP/2 when negotiated).
+
+    Responses are read in full and handed back as urllib3 responses, so callers and auth hooks see the
+    usual requests.Response. Retries are limited to what httpx does (none by default).
+    """
+
+    # Connection-specific headers are not allowed in HTTP/2
+    _HOP_BY_HOP = frozenset(("connection", "keep-alive", "transfer-encoding", "upgrade"))
+
+    def __init__(self, client: Any):
+        import httpx
+
+        super().__init__()
+        self.client = client
+        self._httpx = httpx
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):  # type: ignore[override]
+        if isinstance(timeout, tuple):  # requests-style (connect, read)
+            timeout = self._httpx.Timeout(None, connect=timeout[0], read=timeout[1])
+        headers = [(k, v) for k, v in request.headers.items() if k.lower() not in self._HOP_BY_HOP]
+        r = self.client.request(request.method, request.url, headers=headers, content=request.body, timeout=timeout)
+        body = r.content
+        # httpx has already decoded the body; describe what is actually handed over
+        resp_headers = [
+            (k, v) for k, v in r.headers.multi_items() if k.lower() not in ("content-encoding", "content-length")
+        ]
+        resp_headers.append(("Content-Length", str(len(body))))
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers=resp_headers,
+            status=r.status_code,
+            reason=r.reason_phrase,
+            preload_content=False,
+            decode_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+# Repository-scoped path templates: (repository, suffix) and (repository, pr_id, suffix)
+_REPO_PATH = "/_apis/git/repositories/%s%s"
+_PR_PATH = "/_apis/git/repositories/%s/pullRequests/%s%s"
+
+# Upper bound on memoized endpoint URLs per client
+_URL_CACHE_MAX = 512
+# Azure DevOps accepts at most 200 requests per wit/$batch call, and 200 ids per workitemsbatch call
+_WIT_BATCH_MAX = 200
+WORK_ITEMS_BATCH_SIZE = 200
+# Entries kept for conditional GETs (If-None-Match) per client
+_ETAG_CACHE_MAX = 128
+# Listings kept in memory for cfg.cache_ttl per client
+_TTL_CACHE_MAX = 64
+# Attachment download chunk size; a multiple of 3 so chunks base64-encode without padding
+_ATTACHMENT_CHUNK = 3 * 64 * 1024
+# Responses larger than this are streamed through ijson (when installed) instead of decoded in one piece
+_STREAM_THRESHOLD = 1024 * 1024
+
+
+class AzureDevOpsClientBase:
+    """URL and query parameter helpers shared by the sync and async clients."""
+
+    # Request defaults and body codecs, shared with subclasses in other modules
+    _default_headers: Mapping[str, str] = MappingProxyType(_DEFAULT_HEADERS)
+    _wiki_params = _WIKI_PARAMS
+    _decode = staticmethod(_decode)
+    _serialize = staticmethod(_serialize)
+    _error_detail = staticmethod(_error_detail)
+
+    @staticmethod
+    def pages_without_content(tree: Any) -> List[Dict[str, Any]]:
+        """Pages in a wiki page tree (root and nested subPages) whose content was not returned.
+
+        includeContent only applies to the requested page, not to sub-pages listed by recursionLevel.
+        """
+        missing: List[Dict[str, Any]] = []
+        stack = [tree] if isinstance(tree, dict) else []
+        while stack:
+            page = stack.pop()
+            if page.get("path") and "content" not in page:
+                missing.append(page)
+            stack.extend(sub for sub in page.get("subPages") or () if isinstance(sub, dict))
+        return missing
 
-class AzureDevOpsClient:
     def __init__(self, cfg: AzureDevOpsConfig):
         self.cfg = cfg
-        self.session = requests.Session()
-        self.session.verify = cfg.verify_ssl
-
-        if cfg.auth_type == "pat":
-            # PAT as basic auth: username can be anything, PAT is password
-            token = f":{cfg.pat}".encode("utf-8")
-            b64 = base64.b64encode(token).decode("ascii")
-            self.session.headers.update({
-                "Authorization": f"Basic {b64}",
-            })
-        else:  # ntlm
-            domain_prefix = f"{cfg.ntlm_domain}\\" if cfg.ntlm_domain else ""
-            self.session.auth = HttpNtlmAuth(domain_prefix + cfg.ntlm_username, cfg.ntlm_password)
-
-        # Default headers
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "azure-devops-mcp/0.1.0",
-        })
+        # On-prem often at {base}/tfs/{collection}; allow users to include collection in base or as separate var.
+        # Both are fixed for the client's lifetime, so build the prefix and default params once.
+        if cfg.collection:
+            # URL-encode collection path segment to handle spaces/special chars
+            coll = quote(cfg.collection, safe='')
+            self._prefix = f"{cfg.base_url}/{coll}"
+        else:
+            self._prefix = cfg.base_url
+        api_version = (cfg.api_version or "").strip()
+        # Read-only so it can be handed to requests as-is on every call without copying
+        self._default_params: Mapping[str, Any] = MappingProxyType(
+            {"api-version": api_version} if api_version and api_version.lower() != "none" else {}
+        )
+        self._default_project: Optional[str] = cfg.default_project or None
+        # Default repository with surrounding slashes removed once
+        self._default_repo: Optional[str] = (cfg.default_repository or "").strip("/") or None
+        # Built URLs for fixed endpoints (projects, repositories, PR lists, wikis...) keyed by (path, project)
+        self._url_cache: Dict[Tuple[str, Optional[str]], str] = {}
+        # Collection-level endpoints hit on most tool calls, built up front
+        self._projects_url = f"{self._prefix}/_apis/projects"
+        self._workitems_batch_url = f"{self._prefix}/_apis/wit/workitemsbatch"
+        self._wit_batch_url = f"{self._prefix}/_apis/wit/$batch"
+        # Target URL prefix for relation (link) ops
+        self._relation_url_prefix = f"{self._prefix}/_apis/wit/workItems/"
 
     # URL helpers
     def _collection_prefix(self) -> str:
-        # On-prem often at {base}/tfs/{collection}; allow users to include collection in base or as separate var
-        if self.cfg.collection:
-            # URL-encode collection path segment to handle spaces/special chars
-            coll = quote(self.cfg.collection.strip('/'), safe='')
-            return f"{self.cfg.base_url}/{coll}"
-        return self.cfg.base_url
+        return self._prefix
 
     def _api(self, path: str, project: Optional[str] = None, params: Optional[Dict[str, Any]] = None) -> str:
-        base = self._collection_prefix()
+        key = (path, project)
+        url = self._url_cache.get(key)
+        if url is not None:
+            return url
+        base = self._prefix
         if project:
             # URL-encode project path segment to handle spaces/special chars
             enc_proj = quote(project.strip('/'), safe='')
             base = f"{base}/{enc_proj}"
         if not path.startswith("/"):
             path = "/" + path
-        # Always include api-version if not present in params
-        if params is None or "api-version" not in (params or {}):
-            # We add api-version as query string later via requests params
-            pass
-        return f"{base}{path}"
-
-    def _ensure_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-        p = dict(params or {})
+        # api-version is added as a query parameter (session default or _ensure_params)
+        url = f"{base}{path}"
+        # Only memoize endpoints without numeric ids (work item, PR, plan...) so the cache stays small
+        if len(self._url_cache) < _URL_CACHE_MAX and not any(seg.isdigit() for seg in path.split("/")):
+            self._url_cache[key] = url
+        return url
+
+    def _resolve_project(self, project: Optional[str]) -> str:
+        if not (proj := project or self._default_project):
+            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
+        return proj
+
+    def _resolve(self, project: Optional[str], repository: Optional[str]) -> Tuple[str, str]:
+        """Resolve project and repository from arguments or configured defaults."""
+        proj = self._resolve_project(project)
+        if not (repo := repository.strip("/") if repository else self._default_repo):
+            raise AzureDevOpsError("Repository is required (set AZDO_REPOSITORY or pass repository)")
+        return proj, repo
+
+    @staticmethod
+    def _repo_path(repo: str, suffix: str = "") -> str:
+        return _REPO_PATH % (repo, suffix)
+
+    @staticmethod
+    def _pr_path(repo: str, pr_id: int, suffix: str = "") -> str:
+        return _PR_PATH % (repo, pr_id, suffix)
+
+    def _ensure_params(self, params: Optional[Mapping[str, Any]]) -> Mapping[str, Any]:
+        if not params:
+            return self._default_params
+        if params is _NO_API_VERSION:
+            return _NO_PARAMS
+        val = params.get("api-version")
+        # Real versions ("7.1", "7.1-preview.1") start with a digit: pass the caller's mapping through untouched
+        if val.__class__ is str and val[:1].isdigit():
+            return params
+        # Configured api-version unless the caller provides one
+        if "api-version" not in params:
+            return {**self._default_params, **params}
         # Respect explicit opt-out: if caller passes api-version as None/empty/'none', omit it entirely
-        if "api-version" in p:
-            val = p.get("api-version")
-            if val is None or (isinstance(val, str) and val.strip().lower() in ("", "none")):
-                p.pop("api-version", None)
-                return p
-        # Only add api-version if not already provided and configured value is set
-        if "api-version" not in p:
-            v = (self.cfg.api_version or "").strip()
-            if v and v.lower() != "none":
-                p["api-version"] = v
-        return p
+        if val is None or (isinstance(val, str) and val.strip().lower() in ("", "none")):
+            return {k: v for k, v in params.items() if k != "api-version"}
+        return params
+
+
+class AzureDevOpsClient(AzureDevOpsClientBase):
+    def __init__(self, cfg: AzureDevOpsConfig, warm: bool = False, http2: Optional[bool] = None):
+        super().__init__(cfg)
+        if http2 is None:
+            http2 = cfg.http2
+        # requests.Session is not thread-safe, so each calling thread lazily gets its own (see `session`)
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        # The PAT header is formatted once per config and shared by every session
+        self._auth_header = cfg.pat_auth_header if cfg.auth_type == "pat" else None
+        # Optional HTTP/2 transport (httpx), shared by all sessions: every call multiplexes over one connection
+        self._http2 = http2
+        self._http2_client: Any = None
+        if http2:
+            if cfg.auth_type != "pat":
+                # NTLM authenticates a connection, which HTTP/2 multiplexing does not allow (IIS downgrades it)
+                raise AzureDevOpsError("HTTP/2 is only supported with PAT auth")
+            try:
+                import httpx  # noqa: F401
+            except ImportError as e:
+                raise AzureDevOpsError("HTTP/2 requires the httpx package (install the async extra)") from e
+
+        # Last known wiki page versions (eTags) keyed by (project, wiki, path); saves a lookup per update
+        self._page_version_cache: Dict[Tuple[str, str, str], str] = {}
+        # (ETag, raw body) of recent GETs keyed by (url, params); a 304 revalidation reuses the body
+        self._etag_cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[str, bytes]] = {}
+        self._cache_lock = threading.Lock()
+        # (expiry, raw body) for listings served without a request while fresh (cfg.cache_ttl)
+        self._ttl_cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[float, bytes]] = {}
+
+        if warm:
+            self.warm_up()
+
+    def warm_up(self) -> Dict[str, Any]:
+        """Open (and for NTLM, authenticate) a pooled connection ahead of the first real call."""
+        return self._get(f"{self._prefix}/_apis/connectionData")
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's session, created on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._new_session()
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def _new_session(self) -> requests.Session:
+        cfg = self.cfg
+        session = requests.Session()
+        session.verify = cfg.verify_ssl
+
+        # Retries on throttling/transient errors. Only idempotent methods are retried so work item
+        # creation or link adds are never duplicated.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS"]),
+            raise_on_status=False,
+        )
+        if self._auth_header is not None:
+            session.headers["Authorization"] = self._auth_header
+            # Larger keep-alive pool for bursts of calls to the same server
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        else:  # ntlm
+            session.auth = cfg.ntlm_auth
+            # NTLM authenticates the socket, not the request: a small blocking pool waits for an
+            # already-authenticated connection instead of opening (and handshaking) a new one
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, pool_block=True, max_retries=retry)
+        # Mounted for both schemes so attachment downloads and redirects to other hosts share the tuned pool
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if self._http2:
+            session.mount(f"{self._prefix}/", _HttpxAdapter(self._http2_transport()))
+
+        # Default headers
+        session.headers.update(_DEFAULT_HEADERS)
+        # Some older on-prem TFS proxies close connections unless asked explicitly; NTLM auth is per connection,
+        # so every dropped socket means a new 3-leg handshake
+        session.headers["Connection"] = "keep-alive"
+        # Configured api-version as a session default; requests merges it into every call (see _ensure_params)
+        session.params = dict(self._default_params)
+        return session
+
+    def _ensure_params(self, params: Optional[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+        # The default api-version comes from session.params. requests drops merged keys whose value is None,
+        # so an opt-out only has to be expressed as None.
+        if not params or params is _NO_API_VERSION:
+            return params
+        val = params.get("api-version")
+        if val.__class__ is str and not val[:1].isdigit() and val.strip().lower() in ("", "none"):
+            return {**params, "api-version": None}
+        return params
+
+    def _http2_transport(self) -> Any:
+        with self._sessions_lock:
+            if self._http2_client is None:
+                import httpx
+
+                self._http2_client = httpx.Client(
+                    http2=True,
+                    verify=self.cfg.verify_ssl,
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                    timeout=None,
+                )
+            return self._http2_client
+
+    def close(self) -> None:
+        """Close pooled connections held by every thread's session."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+            client, self._http2_client = self._http2_client, None
+        for session in sessions:
+            session.close()
+        if client is not None:
+            client.close()
+        self._local = threading.local()
 
     # Basic HTTP helpers
-    def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        resp = self.session.get(url, params=self._ensure_params(params))
-        if not resp.ok:
-            raise AzureDevOpsError(f"GET {url} failed: {resp.status_code} {resp.text}")
-        return resp.json()
-
-    def _post(self, url: str, json: Any, params: Optional[Dict[str, Any]] = None, content_type: Optional[str] = None) -> Dict[str, Any]:
-        headers = {}
-        if content_type:
-            headers["Content-Type"] = content_type
-        resp = self.session.post(url, json=json, params=self._ensure_params(params), headers=headers)
-        if not resp.ok:
-            raise AzureDevOpsError(f"POST {url} failed: {resp.status_code} {resp.text}")
-        return resp.json()
-
-    def _patch(self, url: str, json: Any, params: Optional[Dict[str, Any]] = None, content_type: Optional[str] = None) -> Dict[str, Any]:
-        headers = {}
-        if content_type:
-            headers["Content-Type"] = content_type
-        resp = self.session.patch(url, json=json, params=self._ensure_params(params), headers=headers)
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        json: Any = None,
+        content_type: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[bytes] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Issue a request and return the response, raising AzureDevOpsError on failure.
+
+        The body is either `json` (serialized here) or already-serialized `data` bytes.
+        """
+        # Common cases reuse the session defaults or a prebuilt mapping instead of building a dict per call
+        hdrs: Optional[Mapping[str, str]]
+        if headers:
+            hdrs = {**headers, "Content-Type": content_type} if content_type else headers
+        elif content_type == _JSON_PATCH:
+            hdrs = _JSON_PATCH_HEADERS
+        else:
+            hdrs = {"Content-Type": content_type} if content_type else None
+        if json is not None:
+            data = _serialize(json)
+        resp = self.session.request(
+            method,
+            url,
+            params=self._ensure_params(params),
+            data=data,
+            headers=hdrs,
+            stream=stream,
+            timeout=self.cfg.timeout,
+        )
         if not resp.ok:
-            raise AzureDevOpsError(f"PATCH {url} failed: {resp.status_code} {resp.text}")
-        return resp.json()
+            self._raise_for(resp, method, url)
+        return resp
+
+    @staticmethod
+    def _raise_for(resp: requests.Response, method: str, url: str) -> None:
+        """Raise AzureDevOpsError for a failed response without reading more of the body than needed."""
+        length = resp.headers.get("Content-Length")
+        if resp.raw is None or resp.raw.closed or (length is not None and int(length) <= _ERROR_BODY_MAX):
+            # Already read (non-streamed) or small: reading it all puts the connection back in the pool
+            detail = _error_detail(resp)
+        else:
+            # Large or unknown-length streamed body (HTML error pages): read the head and drop the connection
+            head = resp.raw.read(_ERROR_BODY_MAX, decode_content=True)
+            resp.close()
+            detail = head.decode("utf-8", errors="replace")
+        raise AzureDevOpsError(f"{method} {url} failed: {resp.status_code} {detail}", status_code=resp.status_code)
+
+    def _get(self, url: str, params: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        return _loads(self._get_body(url, params))
+
+    def _get_body(self, url: str, params: Optional[Mapping[str, Any]] = None) -> bytes:
+        """GET the raw response body, revalidating a cached copy with If-None-Match.
+
+        Bytes rather than decoded objects are cached so every caller decodes its own copy: a result mutated
+        in place never leaks into a later 304 hit.
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        cached = self._etag_cache.get(key)
+        resp = self._send("GET", url, params=params, headers={"If-None-Match": cached[0]} if cached else None)
+        if cached and resp.status_code == 304:
+            return cached[1]
+        body = resp.content
+        etag = resp.headers.get("ETag")
+        if etag and len(body) <= _STREAM_THRESHOLD:
+            # The client is shared across threads; evict-and-insert must not interleave
+            with self._cache_lock:
+                if key not in self._etag_cache and len(self._etag_cache) >= _ETAG_CACHE_MAX:
+                    # Evict the oldest entry
+                    self._etag_cache.pop(next(iter(self._etag_cache)))
+                self._etag_cache[key] = (etag, body)
+        return body
+
+    def _get_listing(self, url: str, params: Optional[Mapping[str, Any]] = None) -> List[Dict[str, Any]]:
+        """GET the `value` list of a rarely-changing listing: served from memory for cfg.cache_ttl seconds.
+
+        Once expired, the refresh is still a conditional GET, so an unchanged listing costs a 304. The raw body
+        is cached and decoded per call, so callers may modify the result freely.
+        """
+        ttl = self.cfg.cache_ttl
+        if ttl <= 0:
+            return self._get(url, params).get("value", [])
+        key = (url, tuple(sorted(params.items())) if params else ())
+        hit = self._ttl_cache.get(key)
+        now = time.monotonic()
+        if hit is not None and hit[0] > now:
+            return _loads(hit[1]).get("value", [])
+        body = self._get_body(url, params)
+        with self._cache_lock:
+            if key not in self._ttl_cache and len(self._ttl_cache) >= _TTL_CACHE_MAX:
+                # Evict the oldest entry
+                self._ttl_cache.pop(next(iter(self._ttl_cache)))
+            self._ttl_cache[key] = (now + ttl, body)
+        return _loads(body).get("value", [])
+
+    def _post(self, url: str, json: Any, params: Optional[Mapping[str, Any]] = None, content_type: Optional[str] = None) -> Dict[str, Any]:
+        return _decode(self._send("POST", url, params=params, json=json, content_type=content_type))
+
+    def _patch(self, url: str, json: Any, params: Optional[Mapping[str, Any]] = None, content_type: Optional[str] = None) -> Dict[str, Any]:
+        return _decode(self._send("PATCH", url, params=params, json=json, content_type=content_type))
 
     def _put(
         self,
         url: str,
         json: Any,
-        params: Optional[Dict[str, Any]] = None,
+        params: Optional[Mapping[str, Any]] = None,
         content_type: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
-        hdrs: Dict[str, str] = dict(headers or {})
-        if content_type:
-            hdrs["Content-Type"] = content_type
-        resp = self.session.put(url, json=json, params=self._ensure_params(params), headers=hdrs)
-        if not resp.ok:
-            raise AzureDevOpsError(f"PUT {url} failed: {resp.status_code} {resp.text}")
-        return resp.json()
+        return _decode(self._send("PUT", url, params=params, json=json, content_type=content_type, headers=headers))
 
-    def _delete(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        resp = self.session.delete(url, params=self._ensure_params(params))
-        if not resp.ok:
-            raise AzureDevOpsError(f"DELETE {url} failed: {resp.status_code} {resp.text}")
+    def _delete(self, url: str, params: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        resp = self._send("DELETE", url, params=params)
         # Some delete endpoints return an empty body
+        if not resp.content:
+            return {"status": resp.status_code}
         try:
-            return resp.json()
-        except Exception:
+            return _decode(resp)
+        except ValueError:
             return {"status": resp.status_code}
 
-    def _get_raw(self, url: str, params: Optional[Dict[str, Any]] = None) -> bytes:
-        resp = self.session.get(url, params=self._ensure_params(params), stream=False)
-        if not resp.ok:
-            raise AzureDevOpsError(f"GET {url} failed: {resp.status_code} {resp.text}")
-        return resp.content
+    def _head(self, url: str, params: Optional[Mapping[str, Any]] = None) -> requests.Response:
+        # Not routed through _send: callers only probe headers and fall back to GET when HEAD is not answered
+        return self.session.head(url, params=self._ensure_params(params), timeout=self.cfg.timeout)
+
+    def _get_raw(self, url: str, params: Optional[Mapping[str, Any]] = None) -> bytes:
+        return self._send("GET", url, params=params).content
 
     # Public API
     def list_projects(self) -> List[Dict[str, Any]]:
-        url = self._api("/_apis/projects")
-        data = self._get(url)
-        return data.get("value", [])
+        url = self._projects_url
+        return self._get_listing(url)
 
-    def wiql_query(self, wiql: str, project: Optional[str] = None, top: Optional[int] = None) -> List[int]:
-        proj = project or self.cfg.default_project
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
+    def wiql_query(self, wiql: str, project: Optional[str] = None, top: Optional[int] = None) -> Sequence[int]:
+        """Run a WIQL query and return the matching work item ids.
+
+        Ids are returned as a compact `array('i')` rather than a list of int objects.
+        """
+        proj = self._resolve_project(project)
         url = self._api("/_apis/wit/wiql", project=proj)
         payload: Dict[str, Any] = {"query": wiql}
         if top is not None:
             payload["top"] = top
-        data = self._post(url, json=payload)
+        with self._send("POST", url, json=payload, stream=True) as resp:
+            # Large result sets: pull just the ids off the wire instead of building every {id, url} dict
+            if ijson is not None and int(resp.headers.get("Content-Length") or 0) > _STREAM_THRESHOLD:
+                resp.raw.decode_content = True
+                return array("i", ijson.items(resp.raw, "workItems.item.id"))
+            body = resp.raw.read(decode_content=True)
+        if simdjson is not None:
+            # Lazy document: only each item's id is converted to a Python object, never the {id, url} dicts.
+            # Items always carry an id.
+            return array("i", [it["id"] for it in _simdjson_parser().parse(body).get("workItems", ())])
+        data = _loads(body)
         # WIQL returns workItems: [{id, url}]
-        items = data.get("workItems", [])
-        return [it.get("id") for it in items if "id" in it]
+        ids = array("i")
+        for it in data.get("workItems", []):
+            wid = it.get("id")
+            if wid is not None:
+                ids.append(wid)
+        return ids
 
     def get_work_item(self, id: int, expand: Optional[str] = None) -> Dict[str, Any]:
         url = self._api(f"/_apis/wit/workitems/{id}")
-        params = {}
-        if expand:
-            params["$expand"] = expand
-        return self._get(url, params=params)
+        return self._get(url, params={"$expand": expand} if expand else None)
+
+    def get_work_items(self, ids: Sequence[int], expand: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch work items by id, in first-seen order with duplicates dropped.
 
-    def get_work_items(self, ids: List[int], expand: Optional[str] = None) -> List[Dict[str, Any]]:
+        More than 200 ids are sent as consecutive workitemsbatch calls.
+        """
         if not ids:
             return []
-        url = self._api("/_apis/wit/workitemsbatch")
-        body: Dict[str, Any] = {"ids": ids}
-        if expand:
-            body["$expand"] = expand
-        data = self._post(url, json=body)
-        return data.get("value", []) or data.get("workItems", [])
+        uniq = list(dict.fromkeys(ids))
+        url = self._workitems_batch_url
+        items: List[Dict[str, Any]] = []
+        for i in range(0, len(uniq), WORK_ITEMS_BATCH_SIZE):
+            body: Dict[str, Any] = {"ids": uniq[i:i + WORK_ITEMS_BATCH_SIZE]}
+            if expand:
+                body["$expand"] = expand
+            with self._send("POST", url, json=body, stream=True) as resp:
+                data = _decode_stream(resp)
+            items.extend(data.get("value", []) or data.get("workItems", []))
+        return items
 
     def create_work_item(
         self,
         project: str,
         work_item_type: str,
-        fields: Dict[str, Any],
+        fields: Optional[Dict[str, Any]] = None,
+        ops: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
+        """Create a work item from a `fields` mapping or ready-made JSON-Patch `ops` (see build_patch_ops)."""
         url = self._api(f"/_apis/wit/workitems/${work_item_type}", project=project)
-        patch_ops: List[Dict[str, Any]] = []
-        for key, value in fields.items():
-            patch_ops.append({"op": "add", "path": f"/fields/{key}", "value": value})
-        return self._patch(url, json=patch_ops, content_type="application/json-patch+json")
+        body = _serialize(ops) if ops is not None else self._patch_bytes_from_fields(fields or {})
+        return _decode(self._send("PATCH", url, data=body, content_type=_JSON_PATCH))
+
+    def create_work_items_bulk(
+        self,
+        project: str,
+        work_item_type: str,
+        fields_list: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Create many work items of one type via `_apis/wit/$batch` (one round trip per 200 items).
+
+        If some items fail, AzureDevOpsBatchError.results still holds the ones that were created.
+        """
+        enc_proj = quote(project.strip('/'), safe='')
+        enc_type = quote(work_item_type, safe='')
+        entries = [
+            {
+                "method": "PATCH",
+                "uri": self._batch_uri(f"/{enc_proj}/_apis/wit/workitems/${enc_type}"),
+                "headers": {"Content-Type": _JSON_PATCH},
+                "body": self.patch_from_fields(fields),
+            }
+            for fields in fields_list
+        ]
+        return self._wit_batch(entries)
 
     def update_work_item(self, id: int, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
         url = self._api(f"/_apis/wit/workitems/{id}")
-        return self._patch(url, json=ops, content_type="application/json-patch+json")
+        return self._patch(url, json=ops, content_type=_JSON_PATCH)
 
-    def add_history_comment(self, id: int, text: str) -> Dict[str, Any]:
-        ops = [{"op": "add", "path": "/fields/System.History", "value": text}]
-        return self.update_work_item(id, ops)
+    def update_work_items_many(self, updates: List[Tuple[int, List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """Apply JSON-Patch ops to many work items via `_apis/wit/$batch`.
 
-    def link_work_items(self, source_id: int, target_id: int, link_type: str) -> Dict[str, Any]:
-        # Relation object requires URL to target work item
-        target_url = f"{self._collection_prefix()}/_apis/wit/workItems/{target_id}"
-        ops = [
+        Same effect as calling update_work_item per item, but one round trip per
+        200 items; prefer it when updating or linking many work items.
+        """
+        entries = [
             {
-                "op": "add",
-                "path": "/relations/-",
-                "value": {"rel": link_type, "url": target_url},
+                "method": "PATCH",
+                "uri": self._batch_uri(f"/_apis/wit/workitems/{id}"),
+                "headers": {"Content-Type": _JSON_PATCH},
+                "body": ops,
             }
+            for id, ops in updates
         ]
-        return self.update_work_item(source_id, ops)
+        return self._wit_batch(entries)
+
+    def _batch_uri(self, path: str) -> str:
+        # Batch entries address collection-relative URIs and carry their own api-version
+        api_version = self._default_params.get("api-version")
+        return f"{path}?api-version={api_version}" if api_version else path
+
+    def _wit_batch(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send entries in chunks of 200 and return their response bodies in request order.
+
+        $batch is not transactional: every chunk is sent even after a failure, and if any entry failed
+        AzureDevOpsBatchError reports which ones, along with the bodies of those that were applied.
+        """
+        url = self._wit_batch_url
+        results: List[Optional[Dict[str, Any]]] = []
+        failures: Dict[int, Tuple[int, Any]] = {}
+        for start in range(0, len(entries), _WIT_BATCH_MAX):
+            chunk = entries[start:start + _WIT_BATCH_MAX]
+            try:
+                data = self._post(url, json=chunk)
+            except AzureDevOpsError as e:
+                # The whole chunk was rejected; none of its entries were applied
+                for offset in range(len(chunk)):
+                    failures[start + offset] = (e.status_code or 0, str(e))
+                results.extend([None] * len(chunk))
+                continue
+            for offset, item in enumerate(data.get("value", [])):
+                # Each batch response carries its own status code and a JSON-encoded body
+                body = item.get("body")
+                if isinstance(body, str) and body:
+                    body = _loads(body)
+                code = item.get("code") or 0
+                if code >= 400:
+                    failures[start + offset] = (code, body)
+                    body = None
+                results.append(body)
+        if failures:
+            detail = "; ".join(
+                f"#{i} {entries[i]['method']} {entries[i]['uri']}: {code} {body}"
+                for i, (code, body) in list(failures.items())[:5]
+            )
+            more = f" (and {len(failures) - 5} more)" if len(failures) > 5 else ""
+            raise AzureDevOpsBatchError(
+                f"Batch: {len(failures)} of {len(entries)} entries failed, the rest were applied: {detail}{more}",
+                results,
+                failures,
+            )
+        return results  # type: ignore[return-value]
+
+    def add_history_comment(self, id: int, text: str) -> Dict[str, Any]:
+        ops = [{"op": "add", "path": _PATH_HISTORY, "value": text}]
+        return self.update_work_item(id, ops)
+
+    def assign_work_item(self, id: int, assigned_to: str) -> Dict[str, Any]:
+        ops = [{"op": "add", "path": _PATH_ASSIGNED_TO, "value": assigned_to}]
+        return self.update_work_item(id, ops)
+
+    def transition_state(self, id: int, new_state: str) -> Dict[str, Any]:
+        ops = [{"op": "add", "path": _PATH_STATE, "value": new_state}]
+        return self.update_work_item(id, ops)
+
+    def _relation_op(self, target_id: int, link_type: str) -> Dict[str, Any]:
+        # Relation object requires URL to target work item
+        return {
+            "op": "add",
+            "path": _PATH_RELATIONS_APPEND,
+            "value": {"rel": link_type, "url": f"{self._relation_url_prefix}{target_id}"},
+        }
+
+    def link_work_items(self, source_id: int, target_id: int, link_type: str) -> Dict[str, Any]:
+        return self.link_work_items_bulk(source_id, [(target_id, link_type)])
+
+    def link_work_items_bulk(self, source_id: int, targets: List[Tuple[int, str]]) -> Dict[str, Any]:
+        """Link one work item to many targets given as (target_id, link_type), in a single PATCH."""
+        return self.update_work_item(source_id, [self._relation_op(tid, link_type) for tid, link_type in targets])
+
+    def link_work_items_many(self, links: List[Tuple[int, int, str]]) -> List[Dict[str, Any]]:
+        """Create many links as (source_id, target_id, link_type) in one batch.
+
+        Links sharing a source are combined into a single patch for that work item.
+        """
+        ops_by_source: Dict[int, List[Dict[str, Any]]] = {}
+        for source_id, target_id, link_type in links:
+            ops_by_source.setdefault(source_id, []).append(self._relation_op(target_id, link_type))
+        return self.update_work_items_many(list(ops_by_source.items()))
 
     # Git Repositories
     def list_repositories(self, project: Optional[str] = None) -> List[Dict[str, Any]]:
-        proj = project or self.cfg.default_project
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
+        proj = self._resolve_project(project)
         url = self._api("/_apis/git/repositories", project=proj)
-        data = self._get(url)
-        return data.get("value", [])
+        return self._get_listing(url)
 
     # Pull Requests
     def list_pull_requests(
@@ -222,13 +831,8 @@ class AzureDevOpsClient:
         source_ref_name: Optional[str] = None,
         top: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        proj = project or self.cfg.default_project
-        repo = repository or self.cfg.default_repository
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
-        if not repo:
-            raise AzureDevOpsError("Repository is required (set AZDO_REPOSITORY or pass repository)")
-        url = self._api(f"/_apis/git/repositories/{repo}/pullRequests", project=proj)
+        proj, repo = self._resolve(project, repository)
+        url = self._api(self._repo_path(repo, "/pullRequests"), project=proj)
         params: Dict[str, Any] = {
             "searchCriteria.status": status,
         }
@@ -248,22 +852,15 @@ class AzureDevOpsClient:
     # Test: Plans, Suites, Cases
     def list_test_plans(self, project: Optional[str] = None) -> List[Dict[str, Any]]:
         """List test plans for a project."""
-        proj = project or self.cfg.default_project
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
+        proj = self._resolve_project(project)
         url = self._api("/_apis/test/plans", project=proj)
-        # Omit api-version for compatibility with some on-prem servers
-        data = self._get(url, params={"api-version": None})
-        return data.get("value", [])
+        return self._get_listing(url, params=_NO_API_VERSION)
 
     def list_test_suites(self, plan_id: int, project: Optional[str] = None) -> List[Dict[str, Any]]:
         """List test suites under a test plan."""
-        proj = project or self.cfg.default_project
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
+        proj = self._resolve_project(project)
         url = self._api(f"/_apis/test/plans/{plan_id}/suites", project=proj)
-        data = self._get(url, params={"api-version": None})
-        return data.get("value", [])
+        return self._get_listing(url, params=_NO_API_VERSION)
 
     def list_test_cases(
         self,
@@ -276,11 +873,9 @@ class AzureDevOpsClient:
         Returns lightweight test case references (work item IDs). Use get_work_item
         to fetch full details of the underlying Test Case work item.
         """
-        proj = project or self.cfg.default_project
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
+        proj = self._resolve_project(project)
         url = self._api(f"/_apis/test/plans/{plan_id}/suites/{suite_id}/testcases", project=proj)
-        data = self._get(url, params={"api-version": None})
+        data = self._get(url, params=_NO_API_VERSION)
         return data.get("value", [])
 
     def add_test_case_to_suite(
@@ -291,15 +886,13 @@ class AzureDevOpsClient:
         project: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Add a test case (by work item id) to a test suite."""
-        proj = project or self.cfg.default_project
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
+        proj = self._resolve_project(project)
         url = self._api(
             f"/_apis/test/plans/{plan_id}/suites/{suite_id}/testcases/{test_case_id}",
             project=proj,
         )
         # The API accepts empty body for this POST
-        return self._post(url, json={}, params={"api-version": None})
+        return self._post(url, json={}, params=_NO_API_VERSION)
 
     def remove_test_case_from_suite(
         self,
@@ -309,14 +902,12 @@ class AzureDevOpsClient:
         project: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Remove a test case from a test suite."""
-        proj = project or self.cfg.default_project
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
+        proj = self._resolve_project(project)
         url = self._api(
             f"/_apis/test/plans/{plan_id}/suites/{suite_id}/testcases/{test_case_id}",
             project=proj,
         )
-        return self._delete(url, params={"api-version": None})
+        return self._delete(url, params=_NO_API_VERSION)
 
     def create_test_case(
         self,
@@ -335,7 +926,7 @@ class AzureDevOpsClient:
         Note: authoring rich test steps requires XML in Microsoft.VSTS.TCM.Steps.
         This helper focuses on basic creation; advanced fields can be passed via extra_fields.
         """
-        fields = self.build_fields(
+        ops = self.build_patch_ops(
             title=title or "Untitled",
             description=description,
             assigned_to=assigned_to,
@@ -345,12 +936,18 @@ class AzureDevOpsClient:
             tags=tags,
             extra=extra_fields,
         )
-        return self.create_work_item(project, "Test Case", fields)
+        return self.create_work_item(project, "Test Case", ops=ops)
 
     # Enrichment helpers
-    def get_test_case_work_item(self, id: int) -> Dict[str, Any]:
-        """Fetch a Test Case work item with full expansion."""
-        return self.get_work_item(id, expand="All")
+    def get_test_case_work_item(self, id: int, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Fetch a Test Case work item with full expansion, or only the given `fields`.
+
+        The server rejects `fields` combined with `$expand`, so a field-filtered fetch has no relations or links.
+        """
+        if not fields:
+            return self.get_work_item(id, expand="All")
+        url = self._api(f"/_apis/wit/workitems/{id}")
+        return self._get(url, params={"fields": ",".join(fields)})
 
     @staticmethod
     def parse_test_steps_xml(steps_xml: Optional[str]) -> List[Dict[str, Any]]:
@@ -361,38 +958,8 @@ class AzureDevOpsClient:
         """
         if not steps_xml:
             return []
-        try:
-            import xml.etree.ElementTree as ET
-
-            # Ensure a single root element
-            text = steps_xml.strip()
-            if not text.startswith("<"):
-                return []
-            root = ET.fromstring(text)
-            steps: List[Dict[str, Any]] = []
-            # Typical structure: <steps><step> <parameterizedString>Action</paramStr> <parameterizedString>Expected</paramStr>
-            for step in root.findall('.//step'):
-                pstrs = [ps.text or "" for ps in step.findall('./parameterizedString')]
-                action = pstrs[0] if len(pstrs) >= 1 else ""
-                expected = pstrs[1] if len(pstrs) >= 2 else ""
-                steps.append({"action": action, "expected": expected})
-            # Fallback: older schema may use <description> and <expected>
-            if not steps:
-                for step in root.findall('.//step'):
-                    action = ""
-                    expected = ""
-                    desc = step.find('./description')
-                    if desc is not None and desc.text:
-                        action = desc.text
-                    exp = step.find('./expected')
-                    if exp is not None and exp.text:
-                        expected = exp.text
-                    if action or expected:
-                        steps.append({"action": action, "expected": expected})
-            return steps
-        except Exception:
-            # Parsing best-effort; on failure return no structured steps
-            return []
+        # Parsed steps are cached as immutable pairs; callers always get fresh dicts they may modify
+        return [{"action": action, "expected": expected} for action, expected in _parse_steps(steps_xml)]
 
     @staticmethod
     def extract_attachments_from_work_item(work_item: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -412,6 +979,27 @@ class AzureDevOpsClient:
         # The attachment URL is a fully-qualified API URL; do not add base
         return self._get_raw(attachment_url, params={"api-version": self.cfg.api_version})
 
+    def iter_attachment(self, attachment_url: str, chunk_size: int = _ATTACHMENT_CHUNK) -> Iterator[bytes]:
+        """Stream attachment bytes in chunks of up to `chunk_size` instead of buffering the whole blob."""
+        with self._send("GET", attachment_url, params={"api-version": self.cfg.api_version}, stream=True) as resp:
+            yield from resp.iter_content(chunk_size)
+
+    def download_attachment_base64(self, attachment_url: str) -> str:
+        """Download an attachment as a base64 string, encoding chunk by chunk as the body arrives.
+
+        Peak memory is the encoded output plus one chunk, rather than the raw blob plus its encoding.
+        """
+        out = bytearray()
+        pending = b""
+        for chunk in self.iter_attachment(attachment_url):
+            data = pending + chunk
+            # base64 of a multiple of 3 bytes has no padding, so the pieces concatenate cleanly
+            cut = len(data) - len(data) % 3
+            out += base64.b64encode(data[:cut])
+            pending = data[cut:]
+        out += base64.b64encode(pending)
+        return out.decode("ascii")
+
     def get_suite_test_case_work_items(
         self,
         plan_id: int,
@@ -442,13 +1030,8 @@ class AzureDevOpsClient:
         repository: Optional[str] = None,
         project: Optional[str] = None,
     ) -> Dict[str, Any]:
-        proj = project or self.cfg.default_project
-        repo = repository or self.cfg.default_repository
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
-        if not repo:
-            raise AzureDevOpsError("Repository is required (set AZDO_REPOSITORY or pass repository)")
-        url = self._api(f"/_apis/git/repositories/{repo}/pullRequests/{pr_id}", project=proj)
+        proj, repo = self._resolve(project, repository)
+        url = self._api(self._pr_path(repo, pr_id), project=proj)
         return self._get(url)
 
     def list_pr_commits(
@@ -457,13 +1040,8 @@ class AzureDevOpsClient:
         repository: Optional[str] = None,
         project: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        proj = project or self.cfg.default_project
-        repo = repository or self.cfg.default_repository
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
-        if not repo:
-            raise AzureDevOpsError("Repository is required (set AZDO_REPOSITORY or pass repository)")
-        url = self._api(f"/_apis/git/repositories/{repo}/pullRequests/{pr_id}/commits", project=proj)
+        proj, repo = self._resolve(project, repository)
+        url = self._api(self._pr_path(repo, pr_id, "/commits"), project=proj)
         data = self._get(url)
         return data.get("value", [])
 
@@ -473,13 +1051,8 @@ class AzureDevOpsClient:
         repository: Optional[str] = None,
         project: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        proj = project or self.cfg.default_project
-        repo = repository or self.cfg.default_repository
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
-        if not repo:
-            raise AzureDevOpsError("Repository is required (set AZDO_REPOSITORY or pass repository)")
-        url = self._api(f"/_apis/git/repositories/{repo}/pullRequests/{pr_id}/threads", project=proj)
+        proj, repo = self._resolve(project, repository)
+        url = self._api(self._pr_path(repo, pr_id, "/threads"), project=proj)
         data = self._get(url)
         return data.get("value", [])
 
@@ -499,12 +1072,7 @@ class AzureDevOpsClient:
         support it will include hunk-level diff details; otherwise a file-level
         change list is returned.
         """
-        proj = project or self.cfg.default_project
-        repo = repository or self.cfg.default_repository
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
-        if not repo:
-            raise AzureDevOpsError("Repository is required (set AZDO_REPOSITORY or pass repository)")
+        proj, repo = self._resolve(project, repository)
 
         pr = self.get_pull_request(pr_id, repository=repo, project=proj)
         source_ref = (pr.get("sourceRefName") or "").strip()
@@ -512,7 +1080,7 @@ class AzureDevOpsClient:
         if not source_ref or not target_ref:
             raise AzureDevOpsError("PR missing source/target refs; cannot compute diff")
 
-        url = self._api(f"/_apis/git/repositories/{repo}/diffs/commits", project=proj)
+        url = self._api(self._repo_path(repo, "/diffs/commits"), project=proj)
 
         def _build_params(base_type: str, base: str, target_type: str, target: str) -> Dict[str, Any]:
             p: Dict[str, Any] = {
@@ -568,7 +1136,7 @@ class AzureDevOpsClient:
         Uses the Git items API with download=true to return raw file content.
         version_type: one of commit|branch|tag
         """
-        url = self._api(f"/_apis/git/repositories/{repository}/items", project=project)
+        url = self._api(self._repo_path(repository, "/items"), project=project)
         params: Dict[str, Any] = {
             "path": path,
             "download": "true",
@@ -591,14 +1159,7 @@ class AzureDevOpsClient:
         - side: 'source' | 'target' | 'both'
         Returns base64 content for binary-safe transport along with commit IDs.
         """
-        import base64
-
-        proj = project or self.cfg.default_project
-        repo = repository or self.cfg.default_repository
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
-        if not repo:
-            raise AzureDevOpsError("Repository is required (set AZDO_REPOSITORY or pass repository)")
+        proj, repo = self._resolve(project, repository)
 
         pr = self.get_pull_request(pr_id, repository=repo, project=proj)
         src_commit = ((pr.get("lastMergeSourceCommit") or {}).get("commitId") or "").strip()
@@ -648,13 +1209,8 @@ class AzureDevOpsClient:
         start_line: Optional[int] = None,
         end_line: Optional[int] = None,
     ) -> Dict[str, Any]:
-        proj = project or self.cfg.default_project
-        repo = repository or self.cfg.default_repository
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
-        if not repo:
-            raise AzureDevOpsError("Repository is required (set AZDO_REPOSITORY or pass repository)")
-        url = self._api(f"/_apis/git/repositories/{repo}/pullRequests/{pr_id}/threads", project=proj)
+        proj, repo = self._resolve(project, repository)
+        url = self._api(self._pr_path(repo, pr_id, "/threads"), project=proj)
         body: Dict[str, Any] = {
             "comments": [
                 {
@@ -680,13 +1236,8 @@ class AzureDevOpsClient:
         repository: Optional[str] = None,
         project: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        proj = project or self.cfg.default_project
-        repo = repository or self.cfg.default_repository
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
-        if not repo:
-            raise AzureDevOpsError("Repository is required (set AZDO_REPOSITORY or pass repository)")
-        url = self._api(f"/_apis/git/repositories/{repo}/pullRequests/{pr_id}/reviewers", project=proj)
+        proj, repo = self._resolve(project, repository)
+        url = self._api(self._pr_path(repo, pr_id, "/reviewers"), project=proj)
         data = self._get(url)
         return data.get("value", [])
 
@@ -697,14 +1248,9 @@ class AzureDevOpsClient:
         repository: Optional[str] = None,
         project: Optional[str] = None,
     ) -> Dict[str, Any]:
-        proj = project or self.cfg.default_project
-        repo = repository or self.cfg.default_repository
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
-        if not repo:
-            raise AzureDevOpsError("Repository is required (set AZDO_REPOSITORY or pass repository)")
+        proj, repo = self._resolve(project, repository)
         url = self._api(
-            f"/_apis/git/repositories/{repo}/pullRequests/{pr_id}/reviewers/{reviewer_id}", project=proj
+            self._pr_path(repo, pr_id, f"/reviewers/{reviewer_id}"), project=proj
         )
         # PUT with identity body adds reviewer
         return self._put(url, json={"id": reviewer_id})
@@ -717,14 +1263,9 @@ class AzureDevOpsClient:
         repository: Optional[str] = None,
         project: Optional[str] = None,
     ) -> Dict[str, Any]:
-        proj = project or self.cfg.default_project
-        repo = repository or self.cfg.default_repository
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
-        if not repo:
-            raise AzureDevOpsError("Repository is required (set AZDO_REPOSITORY or pass repository)")
+        proj, repo = self._resolve(project, repository)
         url = self._api(
-            f"/_apis/git/repositories/{repo}/pullRequests/{pr_id}/reviewers/{reviewer_id}", project=proj
+            self._pr_path(repo, pr_id, f"/reviewers/{reviewer_id}"), project=proj
         )
         body = {"vote": vote}
         return self._put(url, json=body)
@@ -740,13 +1281,8 @@ class AzureDevOpsClient:
         completion_options: Optional[Dict[str, Any]] = None,
         status: Optional[str] = None,
     ) -> Dict[str, Any]:
-        proj = project or self.cfg.default_project
-        repo = repository or self.cfg.default_repository
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
-        if not repo:
-            raise AzureDevOpsError("Repository is required (set AZDO_REPOSITORY or pass repository)")
-        url = self._api(f"/_apis/git/repositories/{repo}/pullRequests/{pr_id}", project=proj)
+        proj, repo = self._resolve(project, repository)
+        url = self._api(self._pr_path(repo, pr_id), project=proj)
         body: Dict[str, Any] = {}
         if title is not None:
             body["title"] = title
@@ -805,10 +1341,8 @@ class AzureDevOpsClient:
 
         Uses preview API version for broader compatibility with Wiki endpoints.
         """
-        url = self._api("/_apis/wiki/wikis", project=project or self.cfg.default_project)
-        params = {"api-version": "7.1"}
-        data = self._get(url, params=params)
-        return data.get("value", [])
+        url = self._api("/_apis/wiki/wikis", project=project or self._default_project)
+        return self._get_listing(url, params=_WIKI_PARAMS)
 
     def list_wiki_pages(
         self,
@@ -822,18 +1356,21 @@ class AzureDevOpsClient:
 
         Returns the raw response which includes a `value` array of pages.
         """
-        proj = project or self.cfg.default_project
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
+        proj = self._resolve_project(project)
         url = self._api(f"/_apis/wiki/wikis/{wiki}/pages", project=proj)
-        params: Dict[str, Any] = {"api-version": "7.1"}
+        params: Dict[str, Any] = {**_WIKI_PARAMS}
         if path:
             params["path"] = path
         if recursion_level:
             params["recursionLevel"] = recursion_level
         if include_content:
             params["includeContent"] = "true"
-        return self._get(url, params=params)
+        # Page trees with content can run to several MB
+        with self._send("GET", url, params=params, stream=include_content) as resp:
+            data = _decode_stream(resp) if include_content else _decode(resp)
+        if isinstance(data, dict) and data.get("path"):
+            self._remember_page_version((proj, wiki, data["path"]), resp, data)
+        return data
 
     def get_wiki_page(
         self,
@@ -843,14 +1380,15 @@ class AzureDevOpsClient:
         include_content: bool = True,
     ) -> Dict[str, Any]:
         """Get a single wiki page by path. Returns metadata and optionally content."""
-        proj = project or self.cfg.default_project
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
+        proj = self._resolve_project(project)
         url = self._api(f"/_apis/wiki/wikis/{wiki}/pages", project=proj)
-        params: Dict[str, Any] = {"api-version": "7.1", "path": path}
+        params: Dict[str, Any] = {**_WIKI_PARAMS, "path": path}
         if include_content:
             params["includeContent"] = "true"
-        return self._get(url, params=params)
+        resp = self._send("GET", url, params=params)
+        page = _decode(resp)
+        self._remember_page_version((proj, wiki, path), resp, page)
+        return page
 
     def upsert_wiki_page(
         self,
@@ -861,15 +1399,16 @@ class AzureDevOpsClient:
         comment: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Create or update a wiki page by path with markdown content."""
-        proj = project or self.cfg.default_project
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
+        proj = self._resolve_project(project)
         url = self._api(f"/_apis/wiki/wikis/{wiki}/pages", project=proj)
-        params: Dict[str, Any] = {"api-version": "7.1", "path": path}
+        params: Dict[str, Any] = {**_WIKI_PARAMS, "path": path}
         body: Dict[str, Any] = {"content": content}
         if comment:
             body["comment"] = comment
-        return self._put(url, json=body, params=params)
+        resp = self._send("PUT", url, params=params, json=body)
+        page = _decode(resp)
+        self._remember_page_version((proj, wiki, path), resp, page)
+        return page
 
     def update_wiki_page(
         self,
@@ -883,35 +1422,61 @@ class AzureDevOpsClient:
         """Update an existing wiki page by path with markdown content.
 
         Uses optimistic concurrency via `If-Match` header. If `version` is not
-        provided, the current version is fetched first. This avoids accidentally
-        creating a new page and ensures we edit an existing one.
+        provided, the last version seen by this client is used, or the current
+        version is looked up first. This avoids accidentally creating a new page
+        and ensures we edit an existing one.
         """
-        proj = project or self.cfg.default_project
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
-
-        # Resolve current version if not provided
-        current_version: Optional[str] = version
-        if current_version is None:
-            url_get = self._api(f"/_apis/wiki/wikis/{wiki}/pages", project=proj)
-            params_get: Dict[str, Any] = {"api-version": "7.1", "path": path}
-            page = self._get(url_get, params=params_get)
-            # Azure DevOps typically returns eTag for pages; fall back to version if present
-            current_version = (
-                (page.get("eTag") if isinstance(page, dict) else None)
-                or (str(page.get("version")) if isinstance(page, dict) and page.get("version") is not None else None)
-            )
-            if not current_version:
-                raise AzureDevOpsError("Unable to determine current page version; pass version explicitly")
+        proj = self._resolve_project(project)
 
-        url_put = self._api(f"/_apis/wiki/wikis/{wiki}/pages", project=proj)
-        params_put: Dict[str, Any] = {"api-version": "7.1", "path": path}
+        url = self._api(f"/_apis/wiki/wikis/{wiki}/pages", project=proj)
+        params: Dict[str, Any] = {**_WIKI_PARAMS, "path": path}
+        key = (proj, wiki, path)
         body: Dict[str, Any] = {"content": content}
         if comment:
             body["comment"] = comment
-        # Set If-Match for optimistic concurrency control
-        headers = {"If-Match": str(current_version)}
-        return self._put(url_put, json=body, params=params_put, headers=headers)
+
+        # Resolve current version if not provided
+        current_version: Optional[str] = version or self._page_version_cache.get(key)
+        if current_version is None:
+            current_version = self._fetch_page_version(url, params)
+        try:
+            # Set If-Match for optimistic concurrency control
+            resp = self._send("PUT", url, params=params, json=body, headers={"If-Match": str(current_version)})
+        except AzureDevOpsError as e:
+            # A cached version goes stale when the page is edited elsewhere; look it up again once
+            if version is not None or e.status_code not in (409, 412) or key not in self._page_version_cache:
+                raise
+            self._page_version_cache.pop(key, None)
+            current_version = self._fetch_page_version(url, params)
+            resp = self._send("PUT", url, params=params, json=body, headers={"If-Match": current_version})
+        page = _decode(resp)
+        self._remember_page_version(key, resp, page)
+        return page
+
+    def _fetch_page_version(self, url: str, params: Dict[str, Any]) -> str:
+        """Look up the current eTag of a wiki page, preferring a body-less HEAD request."""
+        resp = self._head(url, params=params)
+        if resp.ok and resp.headers.get("ETag"):
+            return resp.headers["ETag"]
+        # Some servers do not answer HEAD with an ETag; fall back to fetching the page metadata
+        resp = self._send("GET", url, params=params)
+        page = _decode(resp)
+        # Azure DevOps typically returns eTag for pages; fall back to version if present
+        current_version = (
+            resp.headers.get("ETag")
+            or (page.get("eTag") if isinstance(page, dict) else None)
+            or (str(page.get("version")) if isinstance(page, dict) and page.get("version") is not None else None)
+        )
+        if not current_version:
+            raise AzureDevOpsError("Unable to determine current page version; pass version explicitly")
+        return current_version
+
+    def _remember_page_version(self, key: Tuple[str, str, str], resp: requests.Response, page: Any) -> None:
+        etag = resp.headers.get("ETag")
+        if not etag and isinstance(page, dict):
+            etag = page.get("eTag") or (str(page["version"]) if page.get("version") is not None else None)
+        if etag:
+            self._page_version_cache[key] = etag
 
     def delete_wiki_page(
         self,
@@ -921,13 +1486,12 @@ class AzureDevOpsClient:
         comment: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Delete a wiki page by path."""
-        proj = project or self.cfg.default_project
-        if not proj:
-            raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
+        proj = self._resolve_project(project)
         url = self._api(f"/_apis/wiki/wikis/{wiki}/pages", project=proj)
-        params: Dict[str, Any] = {"api-version": "7.1", "path": path}
+        params: Dict[str, Any] = {**_WIKI_PARAMS, "path": path}
         if comment:
             params["comment"] = comment
+        self._page_version_cache.pop((proj, wiki, path), None)
         return self._delete(url, params=params)
 
     # Convenience helpers for common fields
@@ -956,11 +1520,54 @@ class AzureDevOpsClient:
         if iteration_path is not None:
             fields["System.IterationPath"] = iteration_path
         if tags is not None:
-            fields["System.Tags"] = "; ".join(tag.strip() for tag in tags if tag and tag.strip())
+            fields["System.Tags"] = _join_tags(tags)
         if extra:
             fields.update(extra)
         return fields
 
+    @staticmethod
+    def build_patch_ops(
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        state: Optional[str] = None,
+        area_path: Optional[str] = None,
+        iteration_path: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Same fields as build_fields, written straight into JSON-Patch add ops without the intermediate dict."""
+        ops: List[Dict[str, Any]] = []
+        add = ops.append
+        if title is not None:
+            add({"op": "add", "path": _PATH_TITLE, "value": title})
+        if description is not None:
+            add({"op": "add", "path": _PATH_DESCRIPTION, "value": description})
+        if assigned_to is not None:
+            add({"op": "add", "path": _PATH_ASSIGNED_TO, "value": assigned_to})
+        if state is not None:
+            add({"op": "add", "path": _PATH_STATE, "value": state})
+        if area_path is not None:
+            add({"op": "add", "path": _PATH_AREA, "value": area_path})
+        if iteration_path is not None:
+            add({"op": "add", "path": _PATH_ITERATION, "value": iteration_path})
+        if tags is not None:
+            add({"op": "add", "path": _PATH_TAGS, "value": _join_tags(tags)})
+        if extra:
+            extra_ops = [{"op": "add", "path": _FIELDS_PREFIX + k, "value": v} for k, v in extra.items()]
+            if ops:
+                # As in build_fields, `extra` wins over a named field instead of patching it twice
+                overridden = {op["path"] for op in extra_ops}
+                ops = [op for op in ops if op["path"] not in overridden]
+            ops.extend(extra_ops)
+        return ops
+
     @staticmethod
     def patch_from_fields(fields: Dict[str, Any]) -> List[Dict[str, Any]]:
-        return [{"op": "add", "path": f"/fields/{k}", "value": v} for k, v in fields.items()]
+        # Plain concatenation with a shared prefix is cheaper than an f-string per field
+        return [{"op": "add", "path": _FIELDS_PREFIX + k, "value": v} for k, v in fields.items()]
+
+    @classmethod
+    def _patch_bytes_from_fields(cls, fields: Dict[str, Any]) -> bytes:
+        # Serialized JSON-Patch body for a create
+        return _serialize(cls.patch_from_fields(fields))
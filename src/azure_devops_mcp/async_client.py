@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+from .ado_client import WORK_ITEMS_BATCH_SIZE, AzureDevOpsClientBase, AzureDevOpsError
+from .config import AzureDevOpsConfig
+
+try:
+    # HTTP/2 lets concurrent requests multiplex over one connection; HTTP/1.1 stays enabled for
+    # older on-prem servers that do not negotiate h2
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+
+# Default cap on in-flight requests; matches the connection pool so fan-outs never queue inside httpx
+DEFAULT_CONCURRENCY = 16
+
+
+class AsyncAzureDevOpsClient(AzureDevOpsClientBase):
+    """Asyncio client for fan-out reads (many work items, many PRs).
+
+    Mirrors a subset of AzureDevOpsClient; independent requests are issued
+    concurrently over a shared keep-alive pool instead of one after another.
+    """
+
+    def __init__(self, cfg: AzureDevOpsConfig, concurrency: int = DEFAULT_CONCURRENCY):
+        super().__init__(cfg)
+        self._limit = asyncio.Semaphore(concurrency)
+        headers = dict(self._default_headers)
+        auth: Optional[httpx.Auth] = None
+        if cfg.auth_type == "pat":
+            headers["Authorization"] = cfg.pat_auth_header
+        else:  # ntlm
+            try:
+                from httpx_ntlm import HttpNtlmAuth
+            except ImportError as e:
+                raise AzureDevOpsError("NTLM auth with the async client requires the httpx-ntlm package") from e
+            domain_prefix = f"{cfg.ntlm_domain}\\" if cfg.ntlm_domain else ""
+            auth = HttpNtlmAuth(domain_prefix + cfg.ntlm_username, cfg.ntlm_password)
+        self.http = httpx.AsyncClient(
+            headers=headers,
+            auth=auth,
+            verify=cfg.verify_ssl,
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            timeout=cfg.timeout,
+        )
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+
+    async def __aenter__(self) -> "AsyncAzureDevOpsClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    # Basic HTTP helpers
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+    ) -> httpx.Response:
+        content = self._serialize(json) if json is not None else None
+        async with self._limit:
+            resp = await self.http.request(method, url, params=self._ensure_params(params), content=content)
+        if not resp.is_success:
+            raise AzureDevOpsError(
+                f"{method} {url} failed: {resp.status_code} {self._error_detail(resp)}", status_code=resp.status_code
+            )
+        return resp
+
+    async def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self._decode(await self._send("GET", url, params=params))
+
+    async def _post(self, url: str, json: Any, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self._decode(await self._send("POST", url, params=params, json=json))
+
+    def _pr_url(self, pr_id: int, repository: Optional[str], project: Optional[str], suffix: str = "") -> str:
+        proj, repo = self._resolve(project, repository)
+        return self._api(self._pr_path(repo, pr_id, suffix), project=proj)
+
+    # Work items
+    async def get_work_items(self, ids: Sequence[int], expand: Optional[str] = None) -> List[Dict[str, Any]]:
+        if not ids:
+            return []
+        url = self._workitems_batch_url
+        body: Dict[str, Any] = {"ids": list(ids)}
+        if expand:
+            body["$expand"] = expand
+        data = await self._post(url, json=body)
+        return data.get("value", []) or data.get("workItems", [])
+
+    async def get_work_items_many(
+        self,
+        ids: Sequence[int],
+        expand: Optional[str] = None,
+        chunk: int = WORK_ITEMS_BATCH_SIZE,
+    ) -> List[Dict[str, Any]]:
+        """Fetch any number of work items as concurrent workitemsbatch calls of `chunk` ids each.
+
+        Duplicate ids are dropped (first-seen order kept). At most `concurrency` (see __init__) calls are
+        in flight at once.
+        """
+        uniq = list(dict.fromkeys(ids))
+        parts = await asyncio.gather(
+            *(self.get_work_items(uniq[i:i + chunk], expand=expand) for i in range(0, len(uniq), chunk))
+        )
+        return [wi for part in parts for wi in part]
+
+    # Wiki
+    async def list_wiki_pages(
+        self,
+        wiki: str,
+        project: Optional[str] = None,
+        path: Optional[str] = None,
+        recursion_level: Optional[str] = None,
+        include_content: bool = False,
+    ) -> Dict[str, Any]:
+        """List pages for a wiki, like AzureDevOpsClient.list_wiki_pages.
+
+        With `include_content`, every page of the tree gets its content: pages the listing left
+        without it are fetched concurrently and filled in place.
+        """
+        url = self._api(f"/_apis/wiki/wikis/{wiki}/pages", project=self._resolve_project(project))
+        params: Dict[str, Any] = {**self._wiki_params}
+        if path:
+            params["path"] = path
+        if recursion_level:
+            params["recursionLevel"] = recursion_level
+        if include_content:
+            params["includeContent"] = "true"
+        tree = await self._get(url, params)
+        if include_content:
+            missing = self.pages_without_content(tree)
+            pages = await asyncio.gather(
+                *(self._get(url, {**self._wiki_params, "path": p["path"], "includeContent": "true"}) for p in missing)
+            )
+            for page, full in zip(missing, pages):
+                page["content"] = full.get("content")
+        return tree
+
+    async def get_wiki_pages_many(
+        self,
+        wiki: str,
+        paths: Sequence[str],
+        project: Optional[str] = None,
+        include_content: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get several wiki pages concurrently, keyed by path."""
+        url = self._api(f"/_apis/wiki/wikis/{wiki}/pages", project=self._resolve_project(project))
+        extra = {"includeContent": "true"} if include_content else {}
+        pages = await asyncio.gather(*(self._get(url, {**self._wiki_params, "path": p, **extra}) for p in paths))
+        return dict(zip(paths, pages))
+
+    # Pull Requests
+    async def get_pull_request(
+        self,
+        pr_id: int,
+        repository: Optional[str] = None,
+        project: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        return await self._get(self._pr_url(pr_id, repository, project))
+
+    async def list_pr_commits(
+        self,
+        pr_id: int,
+        repository: Optional[str] = None,
+        project: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        data = await self._get(self._pr_url(pr_id, repository, project, "/commits"))
+        return data.get("value", [])
+
+    async def list_pr_threads(
+        self,
+        pr_id: int,
+        repository: Optional[str] = None,
+        project: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        data = await self._get(self._pr_url(pr_id, repository, project, "/threads"))
+        return data.get("value", [])
+
+    async def list_pr_reviewers(
+        self,
+        pr_id: int,
+        repository: Optional[str] = None,
+        project: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        data = await self._get(self._pr_url(pr_id, repository, project, "/reviewers"))
+        return data.get("value", [])
+
+    async def pr_full_details(
+        self,
+        pr_id: int,
+        repository: Optional[str] = None,
+        project: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Fetch a pull request with its commits, threads and reviewers in one concurrent round.
+
+        Over HTTP/2 the four requests share a single connection.
+        """
+        pr, commits, threads, reviewers = await asyncio.gather(
+            self.get_pull_request(pr_id, repository, project),
+            self.list_pr_commits(pr_id, repository, project),
+            self.list_pr_threads(pr_id, repository, project),
+            self.list_pr_reviewers(pr_id, repository, project),
+        )
+        return {"pullRequest": pr, "commits": commits, "threads": threads, "reviewers": reviewers}
+
+    async def list_pr_commits_many(
+        self,
+        pr_ids: Sequence[int],
+        repository: Optional[str] = None,
+        project: Optional[str] = None,
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """List commits for several pull requests concurrently, keyed by PR id."""
+        parts = await asyncio.gather(*(self.list_pr_commits(p, repository, project) for p in pr_ids))
+        return dict(zip(pr_ids, parts))
+
+    async def list_pr_threads_many(
+        self,
+        pr_ids: Sequence[int],
+        repository: Optional[str] = None,
+        project: Optional[str] = None,
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """List discussion threads for several pull requests concurrently, keyed by PR id."""
+        parts = await asyncio.gather(*(self.list_pr_threads(p, repository, project) for p in pr_ids))
+        return dict(zip(pr_ids, parts))
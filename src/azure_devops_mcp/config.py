@@ -1,9 +1,35 @@
+import base64
 import os
 from dataclasses import dataclass
-from typing import Optional
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
 
+# Every variable from_env reads; their values form the cache key
+_ENV_VARS = (
+    "AZDO_BASE_URL",
+    "AZDO_COLLECTION",
+    "AZDO_PROJECT",
+    "AZDO_REPOSITORY",
+    "AZDO_REPO",
+    "AZDO_API_VERSION",
+    "AZDO_AUTH_TYPE",
+    "AZDO_PAT",
+    "AZDO_NTLM_USERNAME",
+    "AZDO_NTLM_PASSWORD",
+    "AZDO_NTLM_DOMAIN",
+    "AZDO_VERIFY_SSL",
+    "AZDO_CACHE_TTL",
+    "AZDO_TIMEOUT",
+    "AZDO_HTTP2",
+)
+_TRUE_VALUES = frozenset(("1", "true", "yes"))
 
-@dataclass
+# Read-only snapshot of the AZDO_* variables, taken on the first from_env call; None until then
+_env: Optional[Mapping[str, str]] = None
+
+
+@dataclass(frozen=True)
 class AzureDevOpsConfig:
     base_url: str
     collection: Optional[str]
@@ -16,44 +42,112 @@ class AzureDevOpsConfig:
     ntlm_password: Optional[str]
     ntlm_domain: Optional[str]
     verify_ssl: bool
+    # Seconds that rarely-changing listings (projects, repositories, test plans/suites, wikis) are served
+    # from memory without asking the server; 0 disables
+    cache_ttl: float = 60.0
+    # Seconds to wait for the server to connect or send data before a call fails
+    timeout: float = 30.0
+    # Multiplex calls over one HTTP/2 connection (PAT auth only; needs httpx, see AzureDevOpsClient)
+    http2: bool = False
+
+    def __post_init__(self) -> None:
+        # Normalized once here so URL building never has to strip them again (frozen: set via object.__setattr__)
+        object.__setattr__(self, "base_url", self.base_url.rstrip("/"))
+        if self.collection:
+            object.__setattr__(self, "collection", self.collection.strip("/"))
+
+    @cached_property
+    def pat_auth_header(self) -> str:
+        """Authorization header value for PAT auth, encoded once per config."""
+        # PAT as basic auth: username can be anything, PAT is password
+        token = f":{self.pat}".encode("utf-8")
+        return "Basic " + base64.b64encode(token).decode("ascii")
+
+    @cached_property
+    def ntlm_auth(self) -> Any:
+        """requests-ntlm auth object for NTLM auth, shared by every client built from this config."""
+        from requests_ntlm import HttpNtlmAuth
+
+        domain_prefix = f"{self.ntlm_domain}\\" if self.ntlm_domain else ""
+        return HttpNtlmAuth(domain_prefix + self.ntlm_username, self.ntlm_password)
 
     @staticmethod
     def from_env() -> "AzureDevOpsConfig":
-        base_url = os.environ.get("AZDO_BASE_URL", "").rstrip("/")
-        if not base_url:
-            raise ValueError(
-                "AZDO_BASE_URL is required (e.g., https://tfs.company.local/tfs or https://devops.company.local/tfs/DefaultCollection)"
-            )
-
-        collection = os.environ.get("AZDO_COLLECTION")
-        default_project = os.environ.get("AZDO_PROJECT")
-        default_repository = os.environ.get("AZDO_REPOSITORY") or os.environ.get("AZDO_REPO")
-        api_version = os.environ.get("AZDO_API_VERSION", "7.0")
-        auth_type = os.environ.get("AZDO_AUTH_TYPE", "pat").lower()
-
-        pat = os.environ.get("AZDO_PAT")
-        ntlm_username = os.environ.get("AZDO_NTLM_USERNAME")
-        ntlm_password = os.environ.get("AZDO_NTLM_PASSWORD")
-        ntlm_domain = os.environ.get("AZDO_NTLM_DOMAIN")
-        verify_ssl = os.environ.get("AZDO_VERIFY_SSL", "true").lower() in ("1", "true", "yes")
-
-        if auth_type not in ("pat", "ntlm"):
-            raise ValueError("AZDO_AUTH_TYPE must be 'pat' or 'ntlm'")
-        if auth_type == "pat" and not pat:
-            raise ValueError("AZDO_PAT is required when AZDO_AUTH_TYPE=pat")
-        if auth_type == "ntlm" and not (ntlm_username and ntlm_password):
-            raise ValueError("AZDO_NTLM_USERNAME and AZDO_NTLM_PASSWORD are required when AZDO_AUTH_TYPE=ntlm")
-
-        return AzureDevOpsConfig(
-            base_url=base_url,
-            collection=collection,
-            default_project=default_project,
-            default_repository=default_repository,
-            api_version=api_version,
-            auth_type=auth_type,
-            pat=pat,
-            ntlm_username=ntlm_username,
-            ntlm_password=ntlm_password,
-            ntlm_domain=ntlm_domain,
-            verify_ssl=verify_ssl,
+        """Build the config from AZDO_* environment variables.
+
+        The variables are read from os.environ once per process and the same instance is returned on
+        every call; use reload_env() to pick up changes made afterwards.
+        """
+        env = _env
+        if env is None:
+            env = _snapshot_env()
+        return _config_from_env(tuple(map(env.get, _ENV_VARS)))
+
+    @staticmethod
+    def reload_env() -> None:
+        """Drop the environment snapshot so the next from_env() call reads os.environ again."""
+        global _env
+        _env = None
+
+
+def _snapshot_env() -> Mapping[str, str]:
+    global _env
+    environ = os.environ
+    _env = MappingProxyType({name: environ[name] for name in _ENV_VARS if name in environ})
+    return _env
+
+
+@lru_cache(maxsize=1)
+def _config_from_env(values: Tuple[Optional[str], ...]) -> AzureDevOpsConfig:
+    env = {name: value for name, value in zip(_ENV_VARS, values) if value is not None}
+    base_url = env.get("AZDO_BASE_URL", "").rstrip("/")
+    if not base_url:
+        raise ValueError(
+            "AZDO_BASE_URL is required (e.g., https://tfs.company.local/tfs or https://devops.company.local/tfs/DefaultCollection)"
         )
+
+    collection = env.get("AZDO_COLLECTION")
+    default_project = env.get("AZDO_PROJECT")
+    default_repository = env.get("AZDO_REPOSITORY") or env.get("AZDO_REPO")
+    api_version = env.get("AZDO_API_VERSION", "7.0")
+    auth_type = env.get("AZDO_AUTH_TYPE", "pat").lower()
+
+    pat = env.get("AZDO_PAT")
+    ntlm_username = env.get("AZDO_NTLM_USERNAME")
+    ntlm_password = env.get("AZDO_NTLM_PASSWORD")
+    ntlm_domain = env.get("AZDO_NTLM_DOMAIN")
+    raw_verify = env.get("AZDO_VERIFY_SSL", "true")
+    verify_ssl = raw_verify in _TRUE_VALUES or raw_verify.lower() in _TRUE_VALUES
+    try:
+        cache_ttl = float(env.get("AZDO_CACHE_TTL", "60"))
+    except ValueError:
+        raise ValueError("AZDO_CACHE_TTL must be a number of seconds") from None
+    try:
+        timeout = float(env.get("AZDO_TIMEOUT", "30"))
+    except ValueError:
+        raise ValueError("AZDO_TIMEOUT must be a number of seconds") from None
+    http2 = env.get("AZDO_HTTP2", "false").lower() in _TRUE_VALUES
+
+    if auth_type not in ("pat", "ntlm"):
+        raise ValueError("AZDO_AUTH_TYPE must be 'pat' or 'ntlm'")
+    if auth_type == "pat" and not pat:
+        raise ValueError("AZDO_PAT is required when AZDO_AUTH_TYPE=pat")
+    if auth_type == "ntlm" and not (ntlm_username and ntlm_password):
+        raise ValueError("AZDO_NTLM_USERNAME and AZDO_NTLM_PASSWORD are required when AZDO_AUTH_TYPE=ntlm")
+
+    return AzureDevOpsConfig(
+        base_url=base_url,
+        collection=collection,
+        default_project=default_project,
+        default_repository=default_repository,
+        api_version=api_version,
+        auth_type=auth_type,
+        pat=pat,
+        ntlm_username=ntlm_username,
+        ntlm_password=ntlm_password,
+        ntlm_domain=ntlm_domain,
+        verify_ssl=verify_ssl,
+        cache_ttl=cache_ttl,
+        timeout=timeout,
+        http2=http2,
+    )
@@ -1,36 +1,87 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
-from typing import Any, Dict, List, Optional
+import threading
+from itertools import chain
+# typing.Dict stays on purpose: FastMCP wraps typing.Dict results as {"result": ...} in the tool output
+# schema but emits a bare object for builtin dict, so switching would change what clients receive
+from typing import Any, Callable, Dict
 
 from mcp.server.fastmcp import FastMCP
 
-from .ado_client import AzureDevOpsClient, AzureDevOpsError
+from .ado_client import WORK_ITEMS_BATCH_SIZE, AzureDevOpsClient, AzureDevOpsError
 from .config import AzureDevOpsConfig
 
 
+_client_lock = threading.Lock()
+_cached_client: AzureDevOpsClient | None = None
+
+
 def _client() -> AzureDevOpsClient:
+    """Shared client for all tools, so calls reuse one warm connection pool.
+
+    Rebuilt after reset_client() when the AZDO_* environment has changed (from_env then returns a new config).
+    """
+    global _cached_client
     cfg = AzureDevOpsConfig.from_env()
-    return AzureDevOpsClient(cfg)
+    client = _cached_client
+    if client is not None and client.cfg is cfg:
+        # Common case: no lock needed to hand out the existing client
+        return client
+    with _client_lock:
+        client = _cached_client
+        if client is None or client.cfg is not cfg:
+            if client is not None:
+                client.close()
+            client = _cached_client = AzureDevOpsClient(cfg)
+        return client
+
+
+def reset_client() -> None:
+    """Close and drop the shared client; the next tool call re-reads AZDO_* and builds a new one."""
+    global _cached_client
+    AzureDevOpsConfig.reload_env()
+    with _client_lock:
+        client, _cached_client = _cached_client, None
+    if client is not None:
+        client.close()
 
 
 mcp = FastMCP("azure-devops-mcp", json_response=True)
 
+# Wiki sub-page content requests in flight at once for list_wiki_pages(include_content=True)
+_WIKI_FETCH_CONCURRENCY = 16
 
-@mcp.tool()
-def list_projects() -> List[Dict[str, Any]]:
+
+def _tool(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Register a blocking tool function as an async MCP tool.
+
+    FastMCP calls sync tools on the event loop, one at a time; running them in a worker thread lets
+    concurrent tool calls overlap their Azure DevOps round trips (the client keeps a session per thread).
+    """
+
+    @functools.wraps(fn)
+    async def run(*args: Any, **kwargs: Any) -> Any:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    return mcp.tool()(run)
+
+
+@_tool
+def list_projects() -> list[Dict[str, Any]]:
     """List accessible Azure DevOps projects."""
-    client = _client()
-    return client.list_projects()
+    return _client().list_projects()
 
 
 @mcp.tool()
-def search_work_items(
+async def search_work_items(
     wiql: str,
-    project: Optional[str] = None,
-    top: Optional[int] = 50,
-    expand: Optional[str] = "Relations",
-) -> List[Dict[str, Any]]:
+    project: str | None = None,
+    top: int | None = 50,
+    expand: str | None = "Relations",
+) -> list[Dict[str, Any]]:
     """Search work items using WIQL; returns expanded work item documents.
 
     - wiql: e.g. "Select [System.Id] From WorkItems Where [System.TeamProject] = @project And [System.WorkItemType] = 'Task' Order By [System.ChangedDate] DESC"
@@ -39,28 +90,49 @@ def search_work_items(
     - expand: None|Relations|Fields|Links|All
     """
     client = _client()
-    ids = client.wiql_query(wiql, project=project, top=top)
-    return client.get_work_items(ids, expand=expand)
+    ids = await asyncio.to_thread(client.wiql_query, wiql, project=project, top=top)
+    return await _fetch_work_items(client, ids, expand)
 
 
-@mcp.tool()
-def get_work_item(id: int, expand: Optional[str] = "All") -> Dict[str, Any]:
+async def _fetch_work_items(
+    client: AzureDevOpsClient, ids: list[int], expand: str | None
+) -> list[Dict[str, Any]]:
+    # Large id lists: fetch the 200-id workitemsbatch chunks concurrently rather than one after another
+    uniq = list(dict.fromkeys(ids))
+    parts = await asyncio.gather(*(
+        asyncio.to_thread(client.get_work_items, uniq[i:i + WORK_ITEMS_BATCH_SIZE], expand=expand)
+        for i in range(0, len(uniq), WORK_ITEMS_BATCH_SIZE)
+    ))
+    return list(chain.from_iterable(parts))
+
+
+@_tool
+def get_work_item(id: int, expand: str | None = "All") -> Dict[str, Any]:
     """Get a single work item by id."""
-    client = _client()
-    return client.get_work_item(id, expand=expand)
+    return _client().get_work_item(id, expand=expand)
 
 
 @mcp.tool()
+async def get_work_items_batch(ids: list[int], expand: str | None = "All") -> list[Dict[str, Any]]:
+    """Get many work items by id in as few round trips as possible; prefer over repeated get_work_item calls.
+
+    - ids: work item ids; duplicates are fetched once
+    - expand: None|Relations|Fields|Links|All
+    """
+    return await _fetch_work_items(_client(), ids, expand)
+
+
+@_tool
 def create_task(
-    project: Optional[str] = None,
+    project: str | None = None,
     title: str = "",
     description: str = "",
-    assigned_to: Optional[str] = None,
-    area_path: Optional[str] = None,
-    iteration_path: Optional[str] = None,
-    tags: Optional[List[str]] = None,
+    assigned_to: str | None = None,
+    area_path: str | None = None,
+    iteration_path: str | None = None,
+    tags: list[str] | None = None,
     work_item_type: str = "Task",
-    state: Optional[str] = None,
+    state: str | None = None,
 ) -> Dict[str, Any]:
     """Create a new work item (default type Task) in a project.
 
@@ -70,7 +142,7 @@ def create_task(
     proj = project or client.cfg.default_project
     if not proj:
         raise AzureDevOpsError("Project is required (set AZDO_PROJECT or pass project)")
-    fields = AzureDevOpsClient.build_fields(
+    ops = AzureDevOpsClient.build_patch_ops(
         title=title or "Untitled",
         description=description or None,
         assigned_to=assigned_to,
@@ -79,24 +151,23 @@ def create_task(
         iteration_path=iteration_path,
         tags=tags,
     )
-    return client.create_work_item(proj, work_item_type, fields)
+    return client.create_work_item(proj, work_item_type, ops=ops)
 
 
-@mcp.tool()
+@_tool
 def update_work_item(
     id: int,
-    title: Optional[str] = None,
-    description: Optional[str] = None,
-    assigned_to: Optional[str] = None,
-    state: Optional[str] = None,
-    add_tags: Optional[List[str]] = None,
-    remove_tags: Optional[List[str]] = None,
-    fields: Optional[Dict[str, Any]] = None,
-    comment: Optional[str] = None,
+    title: str | None = None,
+    description: str | None = None,
+    assigned_to: str | None = None,
+    state: str | None = None,
+    add_tags: list[str] | None = None,
+    remove_tags: list[str] | None = None,
+    fields: Dict[str, Any] | None = None,
+    comment: str | None = None,
 ) -> Dict[str, Any]:
     """Update a work item: set fields/state/assignee/tags and optionally add a comment."""
     client = _client()
-    ops: List[Dict[str, Any]] = []
     # Simple fields
     f = AzureDevOpsClient.build_fields(
         title=title,
@@ -106,12 +177,10 @@ def update_work_item(
     )
     if fields:
         f.update(fields)
-    for k, v in f.items():
-        ops.append({"op": "add", "path": f"/fields/{k}", "value": v})
 
     # Tags adjustments
     if add_tags:
-        ops.append({"op": "add", "path": "/fields/System.Tags", "value": "; ".join(add_tags)})
+        f["System.Tags"] = "; ".join(add_tags)
     if remove_tags:
         # Note: Removing specific tags requires reading current tags and replacing; here we simply replace with a filtered set is not implemented.
         # For safety, we add an explicit replace instruction with computed value if user provided replacement via fields.
@@ -119,68 +188,77 @@ def update_work_item(
 
     # History comment
     if comment:
-        ops.append({"op": "add", "path": "/fields/System.History", "value": comment})
+        f["System.History"] = comment
 
-    return client.update_work_item(id, ops)
+    return client.update_work_item(id, AzureDevOpsClient.patch_from_fields(f))
 
 
-@mcp.tool()
+@_tool
 def add_comment(id: int, text: str) -> Dict[str, Any]:
     """Add a history comment to a work item."""
-    client = _client()
-    return client.add_history_comment(id, text)
+    return _client().add_history_comment(id, text)
 
 
-@mcp.tool()
+@_tool
 def assign_work_item(id: int, assigned_to: str) -> Dict[str, Any]:
     """Assign a work item to a user (display name or email)."""
-    client = _client()
-    ops = [{"op": "add", "path": "/fields/System.AssignedTo", "value": assigned_to}]
-    return client.update_work_item(id, ops)
+    return _client().assign_work_item(id, assigned_to)
 
 
-@mcp.tool()
+@_tool
 def transition_state(id: int, new_state: str) -> Dict[str, Any]:
     """Move a work item to a new state (e.g., New, Active, Resolved, Closed)."""
-    client = _client()
-    ops = [{"op": "add", "path": "/fields/System.State", "value": new_state}]
-    return client.update_work_item(id, ops)
+    return _client().transition_state(id, new_state)
 
 
-@mcp.tool()
+@_tool
 def link_work_items(
     source_id: int,
     target_id: int,
     link_type: str = "System.LinkTypes.Hierarchy-Forward",
 ) -> Dict[str, Any]:
     """Link two work items (default: parent->child hierarchy forward)."""
-    client = _client()
-    return client.link_work_items(source_id, target_id, link_type)
+    return _client().link_work_items(source_id, target_id, link_type)
+
+
+@_tool
+def link_work_items_batch(links: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
+    """Create many work item links in one batch request.
+
+    - links: [{"source_id": 1, "target_id": 2, "link_type": "System.LinkTypes.Related"}, ...]
+      (link_type defaults to parent->child hierarchy forward)
+    """
+    return _client().link_work_items_many([
+        (
+            int(link["source_id"]),
+            int(link["target_id"]),
+            link.get("link_type") or "System.LinkTypes.Hierarchy-Forward",
+        )
+        for link in links
+    ])
 
 
 # Git: Repositories
-@mcp.tool()
-def list_repositories(project: Optional[str] = None) -> List[Dict[str, Any]]:
+@_tool
+def list_repositories(project: str | None = None) -> list[Dict[str, Any]]:
     """List Git repositories for a project."""
-    client = _client()
-    return client.list_repositories(project=project)
+    return _client().list_repositories(project=project)
 
 
 # Git: Pull Requests
-@mcp.tool()
+@_tool
 def list_pull_requests(
-    repository: Optional[str] = None,
-    project: Optional[str] = None,
+    repository: str | None = None,
+    project: str | None = None,
     status: str = "active",
-    creator_id: Optional[str] = None,
-    reviewer_id: Optional[str] = None,
-    target_ref_name: Optional[str] = None,
-    source_ref_name: Optional[str] = None,
-    top: Optional[int] = 25,
-) -> List[Dict[str, Any]]:
+    creator_id: str | None = None,
+    reviewer_id: str | None = None,
+    target_ref_name: str | None = None,
+    source_ref_name: str | None = None,
+    top: int | None = 25,
+) -> list[Dict[str, Any]]:
     """List pull requests in a repository with optional filters."""
-    client = _client()
-    return client.list_pull_requests(
+    return _client().list_pull_requests(
         repository=repository,
         project=project,
         status=status,
@@ -192,14 +270,14 @@ def list_pull_requests(
     )
 
 
-@mcp.tool()
+@_tool
 def get_pr_diffs(
     pr_id: int,
-    repository: Optional[str] = None,
-    project: Optional[str] = None,
+    repository: str | None = None,
+    project: str | None = None,
     include_content: bool = False,
-    top: Optional[int] = None,
-    skip: Optional[int] = None,
+    top: int | None = None,
+    skip: int | None = None,
 ) -> Dict[str, Any]:
     """Get diffs of the code in a Pull Request.
 
@@ -207,8 +285,7 @@ def get_pr_diffs(
     - `include_content=true` requests hunk content where the server supports it; some on-prem versions omit hunks regardless.
     - If branch refs cannot be resolved (TF401175), the server falls back to commit IDs automatically.
     """
-    client = _client()
-    return client.get_pr_diffs(
+    return _client().get_pr_diffs(
         pr_id,
         repository=repository,
         project=project,
@@ -218,45 +295,42 @@ def get_pr_diffs(
     )
 
 
-@mcp.tool()
+@_tool
 def get_pull_request(
     pr_id: int,
-    repository: Optional[str] = None,
-    project: Optional[str] = None,
+    repository: str | None = None,
+    project: str | None = None,
 ) -> Dict[str, Any]:
     """Get a single pull request."""
-    client = _client()
-    return client.get_pull_request(pr_id, repository=repository, project=project)
+    return _client().get_pull_request(pr_id, repository=repository, project=project)
 
 
-@mcp.tool()
+@_tool
 def list_pr_commits(
     pr_id: int,
-    repository: Optional[str] = None,
-    project: Optional[str] = None,
-) -> List[Dict[str, Any]]:
+    repository: str | None = None,
+    project: str | None = None,
+) -> list[Dict[str, Any]]:
     """List commits included in a pull request."""
-    client = _client()
-    return client.list_pr_commits(pr_id, repository=repository, project=project)
+    return _client().list_pr_commits(pr_id, repository=repository, project=project)
 
 
-@mcp.tool()
+@_tool
 def list_pr_threads(
     pr_id: int,
-    repository: Optional[str] = None,
-    project: Optional[str] = None,
-) -> List[Dict[str, Any]]:
+    repository: str | None = None,
+    project: str | None = None,
+) -> list[Dict[str, Any]]:
     """List discussion threads for a pull request."""
-    client = _client()
-    return client.list_pr_threads(pr_id, repository=repository, project=project)
+    return _client().list_pr_threads(pr_id, repository=repository, project=project)
 
 
-@mcp.tool()
+@_tool
 def get_pr_file_content(
     pr_id: int,
     path: str,
-    repository: Optional[str] = None,
-    project: Optional[str] = None,
+    repository: str | None = None,
+    project: str | None = None,
     side: str = "source",
 ) -> Dict[str, Any]:
     """Download file content at a PR's source/target.
@@ -265,8 +339,7 @@ def get_pr_file_content(
     - Returns base64-encoded content plus commit/ref metadata.
     - Uses Git items API with `versionDescriptor` so it works without direct file URL auth.
     """
-    client = _client()
-    return client.get_pr_file_content(
+    return _client().get_pr_file_content(
         pr_id,
         path,
         repository=repository,
@@ -275,19 +348,18 @@ def get_pr_file_content(
     )
 
 
-@mcp.tool()
+@_tool
 def create_pr_comment(
     pr_id: int,
     text: str,
-    repository: Optional[str] = None,
-    project: Optional[str] = None,
-    file_path: Optional[str] = None,
-    start_line: Optional[int] = None,
-    end_line: Optional[int] = None,
+    repository: str | None = None,
+    project: str | None = None,
+    file_path: str | None = None,
+    start_line: int | None = None,
+    end_line: int | None = None,
 ) -> Dict[str, Any]:
     """Create a PR comment (optionally file/line-scoped)."""
-    client = _client()
-    return client.create_pr_comment(
+    return _client().create_pr_comment(
         pr_id,
         text,
         repository=repository,
@@ -298,56 +370,52 @@ def create_pr_comment(
     )
 
 
-@mcp.tool()
+@_tool
 def list_pr_reviewers(
     pr_id: int,
-    repository: Optional[str] = None,
-    project: Optional[str] = None,
-) -> List[Dict[str, Any]]:
+    repository: str | None = None,
+    project: str | None = None,
+) -> list[Dict[str, Any]]:
     """List reviewers and their vote states."""
-    client = _client()
-    return client.list_pr_reviewers(pr_id, repository=repository, project=project)
+    return _client().list_pr_reviewers(pr_id, repository=repository, project=project)
 
 
-@mcp.tool()
+@_tool
 def add_pr_reviewer(
     pr_id: int,
     reviewer_id: str,
-    repository: Optional[str] = None,
-    project: Optional[str] = None,
+    repository: str | None = None,
+    project: str | None = None,
 ) -> Dict[str, Any]:
     """Add a reviewer to a pull request by identity ID."""
-    client = _client()
-    return client.add_pr_reviewer(pr_id, reviewer_id, repository=repository, project=project)
+    return _client().add_pr_reviewer(pr_id, reviewer_id, repository=repository, project=project)
 
 
-@mcp.tool()
+@_tool
 def set_reviewer_vote(
     pr_id: int,
     reviewer_id: str,
     vote: int,
-    repository: Optional[str] = None,
-    project: Optional[str] = None,
+    repository: str | None = None,
+    project: str | None = None,
 ) -> Dict[str, Any]:
     """Set a reviewer's vote on a PR. Votes: -10, -5, 0, 5, 10."""
-    client = _client()
-    return client.set_reviewer_vote(pr_id, reviewer_id, vote, repository=repository, project=project)
+    return _client().set_reviewer_vote(pr_id, reviewer_id, vote, repository=repository, project=project)
 
 
-@mcp.tool()
+@_tool
 def update_pull_request(
     pr_id: int,
-    repository: Optional[str] = None,
-    project: Optional[str] = None,
-    title: Optional[str] = None,
-    description: Optional[str] = None,
-    auto_complete_set: Optional[bool] = None,
-    completion_options: Optional[Dict[str, Any]] = None,
-    status: Optional[str] = None,
+    repository: str | None = None,
+    project: str | None = None,
+    title: str | None = None,
+    description: str | None = None,
+    auto_complete_set: bool | None = None,
+    completion_options: Dict[str, Any] | None = None,
+    status: str | None = None,
 ) -> Dict[str, Any]:
     """Update a pull request title/description/auto-complete/options/status."""
-    client = _client()
-    return client.update_pull_request(
+    return _client().update_pull_request(
         pr_id,
         repository=repository,
         project=project,
@@ -359,20 +427,19 @@ def update_pull_request(
     )
 
 
-@mcp.tool()
+@_tool
 def complete_pull_request(
     pr_id: int,
-    repository: Optional[str] = None,
-    project: Optional[str] = None,
-    delete_source_branch: Optional[bool] = None,
-    merge_commit_message: Optional[str] = None,
-    merge_strategy: Optional[str] = None,
-    transition_work_items: Optional[bool] = None,
-    squash_merge: Optional[bool] = None,
+    repository: str | None = None,
+    project: str | None = None,
+    delete_source_branch: bool | None = None,
+    merge_commit_message: str | None = None,
+    merge_strategy: str | None = None,
+    transition_work_items: bool | None = None,
+    squash_merge: bool | None = None,
 ) -> Dict[str, Any]:
     """Complete (merge) a pull request with optional completion options."""
-    client = _client()
-    return client.complete_pull_request(
+    return _client().complete_pull_request(
         pr_id,
         repository=repository,
         project=project,
@@ -384,53 +451,49 @@ def complete_pull_request(
     )
 
 
-@mcp.tool()
+@_tool
 def abandon_pull_request(
     pr_id: int,
-    repository: Optional[str] = None,
-    project: Optional[str] = None,
+    repository: str | None = None,
+    project: str | None = None,
 ) -> Dict[str, Any]:
     """Abandon (close without merging) a pull request."""
-    client = _client()
-    return client.abandon_pull_request(pr_id, repository=repository, project=project)
+    return _client().abandon_pull_request(pr_id, repository=repository, project=project)
 
 # Test tools
-@mcp.tool()
-def list_test_plans(project: Optional[str] = None) -> List[Dict[str, Any]]:
+@_tool
+def list_test_plans(project: str | None = None) -> list[Dict[str, Any]]:
     """List test plans for a project."""
-    client = _client()
-    return client.list_test_plans(project=project)
+    return _client().list_test_plans(project=project)
 
 
-@mcp.tool()
-def list_test_suites(plan_id: int, project: Optional[str] = None) -> List[Dict[str, Any]]:
+@_tool
+def list_test_suites(plan_id: int, project: str | None = None) -> list[Dict[str, Any]]:
     """List test suites under a test plan."""
-    client = _client()
-    return client.list_test_suites(plan_id, project=project)
+    return _client().list_test_suites(plan_id, project=project)
 
 
-@mcp.tool()
+@_tool
 def list_test_cases(
     plan_id: int,
     suite_id: int,
-    project: Optional[str] = None,
-) -> List[Dict[str, Any]]:
+    project: str | None = None,
+) -> list[Dict[str, Any]]:
     """List test cases assigned to a suite within a plan."""
-    client = _client()
-    return client.list_test_cases(plan_id, suite_id, project=project)
+    return _client().list_test_cases(plan_id, suite_id, project=project)
 
 
-@mcp.tool()
+@_tool
 def create_test_case(
-    project: Optional[str] = None,
+    project: str | None = None,
     title: str = "",
     description: str = "",
-    assigned_to: Optional[str] = None,
-    area_path: Optional[str] = None,
-    iteration_path: Optional[str] = None,
-    tags: Optional[List[str]] = None,
-    state: Optional[str] = None,
-    extra_fields: Optional[Dict[str, Any]] = None,
+    assigned_to: str | None = None,
+    area_path: str | None = None,
+    iteration_path: str | None = None,
+    tags: list[str] | None = None,
+    state: str | None = None,
+    extra_fields: Dict[str, Any] | None = None,
 ) -> Dict[str, Any]:
     """Create a Test Case work item with common fields."""
     client = _client()
@@ -450,44 +513,41 @@ def create_test_case(
     )
 
 
-@mcp.tool()
+@_tool
 def add_test_case_to_suite(
     plan_id: int,
     suite_id: int,
     test_case_id: int,
-    project: Optional[str] = None,
+    project: str | None = None,
 ) -> Dict[str, Any]:
     """Add a test case (by work item id) to a test suite."""
-    client = _client()
-    return client.add_test_case_to_suite(plan_id, suite_id, test_case_id, project=project)
+    return _client().add_test_case_to_suite(plan_id, suite_id, test_case_id, project=project)
 
 
-@mcp.tool()
+@_tool
 def remove_test_case_from_suite(
     plan_id: int,
     suite_id: int,
     test_case_id: int,
-    project: Optional[str] = None,
+    project: str | None = None,
 ) -> Dict[str, Any]:
     """Remove a test case from a test suite."""
-    client = _client()
-    return client.remove_test_case_from_suite(plan_id, suite_id, test_case_id, project=project)
+    return _client().remove_test_case_from_suite(plan_id, suite_id, test_case_id, project=project)
 
 
-@mcp.tool()
+@_tool
 def get_suite_test_case_work_items(
     plan_id: int,
     suite_id: int,
-    project: Optional[str] = None,
-    expand: Optional[str] = "Fields",
-) -> List[Dict[str, Any]]:
+    project: str | None = None,
+    expand: str | None = "Fields",
+) -> list[Dict[str, Any]]:
     """Return underlying Test Case work items for cases in a suite (batch)."""
-    client = _client()
-    return client.get_suite_test_case_work_items(plan_id, suite_id, project=project, expand=expand)
+    return _client().get_suite_test_case_work_items(plan_id, suite_id, project=project, expand=expand)
 
 
-@mcp.tool()
-def get_test_case_steps_from_work_item(work_item: Dict[str, Any]) -> List[Dict[str, Any]]:
+@_tool
+def get_test_case_steps_from_work_item(work_item: Dict[str, Any]) -> list[Dict[str, Any]]:
     """Parse and extract test steps from a Test Case work item fields.
 
     Looks at `Microsoft.VSTS.TCM.Steps` field, parses the XML, and returns
@@ -498,110 +558,114 @@ def get_test_case_steps_from_work_item(work_item: Dict[str, Any]) -> List[Dict[s
     fields = work_item.get('fields') if isinstance(work_item, dict) else None
     if isinstance(fields, dict):
         steps_xml = fields.get('Microsoft.VSTS.TCM.Steps')
-    client = _client()
-    return client.parse_test_steps_xml(steps_xml)
+    return _client().parse_test_steps_xml(steps_xml)
 
 
-@mcp.tool()
-def list_work_item_attachments(work_item: Dict[str, Any]) -> List[Dict[str, Any]]:
+@_tool
+def list_work_item_attachments(work_item: Dict[str, Any]) -> list[Dict[str, Any]]:
     """List attachment metadata (name + URL) from a work item document."""
-    client = _client()
-    return client.extract_attachments_from_work_item(work_item)
+    return _client().extract_attachments_from_work_item(work_item)
 
 
-@mcp.tool()
+@_tool
 def download_attachment(url: str) -> str:
     """Download an attachment by its relation URL and return as base64 string."""
-    import base64
-    client = _client()
-    data = client.download_attachment(url)
-    return base64.b64encode(data).decode('ascii')
+    return _client().download_attachment_base64(url)
 
 
-@mcp.tool()
-def get_test_case_work_item(id: int, expand: Optional[str] = "All") -> Dict[str, Any]:
+@_tool
+def get_test_case_work_item(id: int, expand: str | None = "All") -> Dict[str, Any]:
     """Get a single Test Case work item by id (expanded)."""
-    client = _client()
-    return client.get_test_case_work_item(id)
+    return _client().get_test_case_work_item(id)
 
 
-@mcp.tool()
-def get_test_case_steps(id: int) -> List[Dict[str, Any]]:
+@_tool
+def get_test_case_steps(id: int) -> list[Dict[str, Any]]:
     """Fetch a Test Case work item and extract its steps as {action, expected}."""
     client = _client()
-    wi = client.get_test_case_work_item(id)
+    # Only the steps field is needed; skips every other field and the relations of an "All" expansion
+    wi = client.get_test_case_work_item(id, fields=['Microsoft.VSTS.TCM.Steps'])
     fields = wi.get('fields') if isinstance(wi, dict) else None
     steps_xml = (fields or {}).get('Microsoft.VSTS.TCM.Steps') if isinstance(fields, dict) else None
     return client.parse_test_steps_xml(steps_xml)
 # Wiki tools
-@mcp.tool()
-def list_wikis(project: Optional[str] = None) -> List[Dict[str, Any]]:
+@_tool
+def list_wikis(project: str | None = None) -> list[Dict[str, Any]]:
     """List wikis in a project or collection."""
-    client = _client()
-    return client.list_wikis(project=project or client.cfg.default_project)
+    return _client().list_wikis(project=project)
 
 
 @mcp.tool()
-def list_wiki_pages(
+async def list_wiki_pages(
     wiki: str,
-    project: Optional[str] = None,
-    path: Optional[str] = None,
-    recursion_level: Optional[str] = None,
+    project: str | None = None,
+    path: str | None = None,
+    recursion_level: str | None = None,
     include_content: bool = False,
 ) -> Dict[str, Any]:
     """List pages in a wiki; optionally filter by path and include content."""
     client = _client()
-    return client.list_wiki_pages(
+    tree = await asyncio.to_thread(
+        client.list_wiki_pages,
         wiki=wiki,
         project=project,
         path=path,
         recursion_level=recursion_level,
         include_content=include_content,
     )
+    if include_content:
+        # The listing only carries content for the top page; fetch the sub-pages' content concurrently
+        missing = client.pages_without_content(tree)
+        limit = asyncio.Semaphore(_WIKI_FETCH_CONCURRENCY)
 
+        async def fetch(page: Dict[str, Any]) -> None:
+            async with limit:
+                full = await asyncio.to_thread(client.get_wiki_page, wiki, page["path"], project=project)
+            page["content"] = full.get("content")
 
-@mcp.tool()
+        await asyncio.gather(*map(fetch, missing))
+    return tree
+
+
+@_tool
 def get_wiki_page(
     wiki: str,
     path: str,
-    project: Optional[str] = None,
+    project: str | None = None,
     include_content: bool = True,
 ) -> Dict[str, Any]:
     """Get a single wiki page by path."""
-    client = _client()
-    return client.get_wiki_page(wiki=wiki, path=path, project=project, include_content=include_content)
+    return _client().get_wiki_page(wiki=wiki, path=path, project=project, include_content=include_content)
 
 
-@mcp.tool()
+@_tool
 def upsert_wiki_page(
     wiki: str,
     path: str,
     content: str,
-    project: Optional[str] = None,
-    comment: Optional[str] = None,
+    project: str | None = None,
+    comment: str | None = None,
 ) -> Dict[str, Any]:
     """Create or update a wiki page with markdown content."""
-    client = _client()
-    return client.upsert_wiki_page(wiki=wiki, path=path, content=content, project=project, comment=comment)
+    return _client().upsert_wiki_page(wiki=wiki, path=path, content=content, project=project, comment=comment)
 
 
-@mcp.tool()
+@_tool
 def update_wiki_page(
     wiki: str,
     path: str,
     content: str,
-    project: Optional[str] = None,
-    comment: Optional[str] = None,
-    version: Optional[str] = None,
+    project: str | None = None,
+    comment: str | None = None,
+    version: str | None = None,
 ) -> Dict[str, Any]:
     """Update an existing wiki page with markdown content.
 
     Uses optimistic concurrency via If-Match. Optionally pass a specific
-    version/eTag to guard the update; if omitted, the current version is
-    fetched first.
+    version/eTag to guard the update; if omitted, the last known version is
+    reused or the current version is looked up first.
     """
-    client = _client()
-    return client.update_wiki_page(
+    return _client().update_wiki_page(
         wiki=wiki,
         path=path,
         content=content,
@@ -611,16 +675,15 @@ def update_wiki_page(
     )
 
 
-@mcp.tool()
+@_tool
 def delete_wiki_page(
     wiki: str,
     path: str,
-    project: Optional[str] = None,
-    comment: Optional[str] = None,
+    project: str | None = None,
+    comment: str | None = None,
 ) -> Dict[str, Any]:
     """Delete a wiki page by path."""
-    client = _client()
-    return client.delete_wiki_page(wiki=wiki, path=path, project=project, comment=comment)
+    return _client().delete_wiki_page(wiki=wiki, path=path, project=project, comment=comment)
 
 
 def main():
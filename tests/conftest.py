@@ -0,0 +1,69 @@
+import dataclasses
+import json
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+import requests
+
+from azure_devops_mcp.ado_client import AzureDevOpsClient
+from azure_devops_mcp.config import AzureDevOpsConfig
+
+
+@pytest.fixture
+def cfg() -> AzureDevOpsConfig:
+    """PAT config for a fake server; listing cache off so every call reaches the client."""
+    return AzureDevOpsConfig(
+        base_url="https://devops.example.local/tfs",
+        collection="DefaultCollection",
+        default_project="Project",
+        default_repository="Repo",
+        api_version="7.0",
+        auth_type="pat",
+        pat="pat",
+        ntlm_username=None,
+        ntlm_password=None,
+        ntlm_domain=None,
+        verify_ssl=True,
+        cache_ttl=0,
+    )
+
+
+class FakeSession:
+    """Stand-in for requests.Session that records calls and answers them from `handler`.
+
+    handler(method, url, params, headers) returns (status, body, headers); body is bytes or a JSON-able object.
+    """
+
+    def __init__(self, handler: Callable[..., Tuple[int, Any, Dict[str, str]]]):
+        self.handler = handler
+        self.calls: List[Tuple[str, str, Dict[str, Any], Dict[str, str]]] = []
+
+    def request(self, method: str, url: str, params: Any = None, headers: Any = None, **kwargs: Any) -> requests.Response:
+        params, headers = dict(params or {}), dict(headers or {})
+        self.calls.append((method, url, params, headers))
+        status, body, resp_headers = self.handler(method, url, params, headers)
+        resp = requests.Response()
+        resp.status_code = status
+        resp._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+        resp.headers.update(resp_headers)
+        resp.url = url
+        return resp
+
+    def head(self, url: str, params: Any = None, **kwargs: Any) -> requests.Response:
+        return self.request("HEAD", url, params=params)
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_session(cfg: AzureDevOpsConfig) -> Callable[[Callable[..., Any]], Tuple[AzureDevOpsClient, FakeSession]]:
+    """Build an AzureDevOpsClient whose calls from this thread go to a FakeSession with the given handler."""
+
+    def make(handler: Callable[..., Any], **overrides: Any) -> Tuple[AzureDevOpsClient, FakeSession]:
+        client = AzureDevOpsClient(dataclasses.replace(cfg, **overrides) if overrides else cfg)
+        session = FakeSession(handler)
+        client._local.session = session
+        return client, session
+
+    return make
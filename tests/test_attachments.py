@@ -0,0 +1,47 @@
+"""Attachment download in AzureDevOpsClient: chunked base64 must match encoding the whole body."""
+
+import base64
+import contextlib
+from typing import Any, Iterator, List
+
+import pytest
+
+from azure_devops_mcp.ado_client import AzureDevOpsClient
+from azure_devops_mcp.config import AzureDevOpsConfig
+
+_BODY = bytes(range(256)) * 41 + b"tail"
+
+
+class _StreamedResponse(contextlib.AbstractContextManager):
+    def __init__(self, chunks: List[bytes]):
+        self.chunks = chunks
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        return iter(self.chunks)
+
+
+def _split(body: bytes, sizes: List[int]) -> List[bytes]:
+    chunks, pos, i = [], 0, 0
+    while pos < len(body):
+        size = sizes[i % len(sizes)]
+        chunks.append(body[pos:pos + size])
+        pos += size
+        i += 1
+    return chunks
+
+
+@pytest.mark.parametrize("sizes", [[1], [2], [3], [4, 7, 1], [5, 5, 2], [len(_BODY)], [1000, 1, 2, 3]])
+def test_base64_matches_whole_body_for_uneven_chunks(cfg: AzureDevOpsConfig, sizes: List[int]) -> None:
+    client = AzureDevOpsClient(cfg)
+    client._send = lambda *args, **kwargs: _StreamedResponse(_split(_BODY, sizes))
+    assert client.download_attachment_base64("https://x/_apis/wit/attachments/1") == base64.b64encode(_BODY).decode()
+
+
+@pytest.mark.parametrize("body", [b"", b"a", b"ab", b"abc"])
+def test_base64_of_short_bodies(cfg: AzureDevOpsConfig, body: bytes) -> None:
+    client = AzureDevOpsClient(cfg)
+    client._send = lambda *args, **kwargs: _StreamedResponse([body] if body else [])
+    assert client.download_attachment_base64("https://x/_apis/wit/attachments/1") == base64.b64encode(body).decode()
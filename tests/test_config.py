@@ -0,0 +1,62 @@
+"""AzureDevOpsConfig.from_env: parsing, normalization and the once-per-process environment snapshot."""
+
+from typing import Iterator
+
+import pytest
+
+from azure_devops_mcp import config
+from azure_devops_mcp.config import AzureDevOpsConfig
+
+
+@pytest.fixture(autouse=True)
+def env(monkeypatch: pytest.MonkeyPatch) -> Iterator[pytest.MonkeyPatch]:
+    for name in config._ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("AZDO_BASE_URL", "https://devops.example.local/tfs/")
+    monkeypatch.setenv("AZDO_COLLECTION", "/DefaultCollection/")
+    monkeypatch.setenv("AZDO_PAT", "pat")
+    AzureDevOpsConfig.reload_env()
+    yield monkeypatch
+    # Do not leave a snapshot of this test's environment behind
+    AzureDevOpsConfig.reload_env()
+
+
+def test_values_are_parsed_and_normalized() -> None:
+    cfg = AzureDevOpsConfig.from_env()
+    assert cfg.base_url == "https://devops.example.local/tfs"
+    assert cfg.collection == "DefaultCollection"
+    assert (cfg.auth_type, cfg.api_version, cfg.verify_ssl, cfg.cache_ttl, cfg.timeout, cfg.http2) == (
+        "pat", "7.0", True, 60.0, 30.0, False
+    )
+
+
+def test_same_instance_while_environment_is_unchanged() -> None:
+    assert AzureDevOpsConfig.from_env() is AzureDevOpsConfig.from_env()
+
+
+def test_environment_changes_apply_after_reload(env: pytest.MonkeyPatch) -> None:
+    before = AzureDevOpsConfig.from_env()
+    env.setenv("AZDO_PROJECT", "Project")
+    env.setenv("AZDO_VERIFY_SSL", "false")
+    stale = AzureDevOpsConfig.from_env()
+    assert stale is before
+    assert stale.default_project is None
+
+    AzureDevOpsConfig.reload_env()
+    fresh = AzureDevOpsConfig.from_env()
+    assert fresh is not before
+    assert fresh.default_project == "Project"
+    assert fresh.verify_ssl is False
+
+
+def test_snapshot_is_read_only() -> None:
+    AzureDevOpsConfig.from_env()
+    with pytest.raises(TypeError):
+        config._env["AZDO_PAT"] = "other"  # type: ignore[index]
+
+
+def test_invalid_values_raise(env: pytest.MonkeyPatch) -> None:
+    env.setenv("AZDO_TIMEOUT", "soon")
+    AzureDevOpsConfig.reload_env()
+    with pytest.raises(ValueError, match="AZDO_TIMEOUT"):
+        AzureDevOpsConfig.from_env()
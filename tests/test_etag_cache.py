@@ -0,0 +1,29 @@
+"""Conditional GETs in AzureDevOpsClient: a 304 must serve the body as the server sent it."""
+
+from typing import Any, Dict
+
+
+def _etag_handler(body: Dict[str, Any]) -> Any:
+    def handler(method: str, url: str, params: Dict[str, Any], headers: Dict[str, str]) -> Any:
+        if headers.get("If-None-Match") == '"v1"':
+            return 304, b"", {}
+        return 200, body, {"ETag": '"v1"'}
+
+    return handler
+
+
+def test_mutated_result_does_not_leak_into_304(fake_session: Any) -> None:
+    client, session = fake_session(_etag_handler({"count": 2, "value": [{"commitId": "a"}, {"commitId": "b"}]}))
+    first = client.list_pr_commits(5, repository="Repo", project="Project")
+    first.pop()
+    first[0]["commitId"] = "changed"
+    second = client.list_pr_commits(5, repository="Repo", project="Project")
+    assert second == [{"commitId": "a"}, {"commitId": "b"}]
+    assert [c[3].get("If-None-Match") for c in session.calls] == [None, '"v1"']
+
+
+def test_mutated_work_item_does_not_leak_into_304(fake_session: Any) -> None:
+    client, session = fake_session(_etag_handler({"id": 1, "fields": {"System.Title": "t"}}))
+    client.get_work_item(1)["fields"]["System.Title"] = "changed"
+    assert client.get_work_item(1)["fields"]["System.Title"] == "t"
+    assert len(session.calls) == 2
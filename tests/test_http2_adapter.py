@@ -0,0 +1,81 @@
+"""HTTP/2 transport (_HttpxAdapter): requests sessions routed through an httpx client."""
+
+import dataclasses
+import gzip
+import json
+from typing import Any, List
+
+import pytest
+
+from azure_devops_mcp.ado_client import AzureDevOpsClient, AzureDevOpsError
+from azure_devops_mcp.config import AzureDevOpsConfig
+
+httpx = pytest.importorskip("httpx")
+
+
+def _client(cfg: AzureDevOpsConfig, handler: Any) -> AzureDevOpsClient:
+    client = AzureDevOpsClient(dataclasses.replace(cfg, http2=True))
+    # Picked up by _http2_transport in place of a real HTTP/2 connection
+    transport = httpx.Client(transport=httpx.MockTransport(handler))
+    # Drop httpx's own defaults (Connection: keep-alive, ...) so requests show only what the adapter forwards
+    transport.headers.clear()
+    client._http2_client = transport
+    return client
+
+
+def test_request_is_translated(cfg: AzureDevOpsConfig) -> None:
+    seen: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"id": 7, "fields": {"System.Title": "t"}}, headers={"ETag": '"1"'})
+
+    client = _client(cfg, handler)
+    ops = [{"op": "add", "path": "/fields/System.Title", "value": "t"}]
+    assert client.update_work_item(7, ops)["id"] == 7
+    request = seen[0]
+    assert request.method == "PATCH"
+    assert request.url.path == "/tfs/DefaultCollection/_apis/wit/workitems/7"
+    assert request.url.params["api-version"] == "7.0"
+    assert request.headers["Authorization"] == client.cfg.pat_auth_header
+    assert request.headers["Content-Type"] == "application/json-patch+json"
+    # The session's Connection: keep-alive is hop-by-hop and not valid over HTTP/2
+    assert "connection" not in request.headers
+    assert json.loads(request.content) == ops
+
+
+def test_error_status_maps_to_azure_devops_error(cfg: AzureDevOpsConfig) -> None:
+    client = _client(cfg, lambda request: httpx.Response(404, json={"message": "TF401232: not found"}))
+    with pytest.raises(AzureDevOpsError) as exc:
+        client.get_work_item(1)
+    assert exc.value.status_code == 404
+    assert "TF401232" in str(exc.value)
+
+
+def test_test_plan_urls_drop_api_version(cfg: AzureDevOpsConfig) -> None:
+    seen: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"count": 1, "value": [{"id": 3}]})
+
+    client = _client(dataclasses.replace(cfg, cache_ttl=0), handler)
+    assert client.list_test_plans(project="Project") == [{"id": 3}]
+    assert seen[0].url.path == "/tfs/DefaultCollection/Project/_apis/test/plans"
+    assert "api-version" not in seen[0].url.params
+
+
+def test_http2_requires_pat_auth(cfg: AzureDevOpsConfig) -> None:
+    ntlm = dataclasses.replace(cfg, auth_type="ntlm", pat=None, ntlm_username="user", ntlm_password="pw")
+    with pytest.raises(AzureDevOpsError, match="PAT"):
+        AzureDevOpsClient(ntlm, http2=True)
+
+
+def test_compressed_response_is_handed_over_decoded(cfg: AzureDevOpsConfig) -> None:
+    body = gzip.compress(json.dumps({"id": 1}).encode())
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body, headers={"Content-Encoding": "gzip", "Content-Type": "application/json"})
+
+    client = _client(cfg, handler)
+    assert client.get_work_item(1) == {"id": 1}
@@ -0,0 +1,29 @@
+"""TTL listing cache in AzureDevOpsClient: results are independent copies and the cache stays bounded."""
+
+from typing import Any, Dict
+
+from azure_devops_mcp.ado_client import _TTL_CACHE_MAX
+
+
+def _listing(method: str, url: str, params: Dict[str, Any], headers: Dict[str, str]) -> Any:
+    return 200, {"count": 2, "value": [{"name": "b"}, {"name": "a"}]}, {}
+
+
+def test_listing_served_from_cache_as_a_copy(fake_session: Any) -> None:
+    client, session = fake_session(_listing, cache_ttl=60)
+    first = client.list_projects()
+    first.sort(key=lambda p: p["name"])
+    first.pop()
+    first[0]["name"] = "changed"
+    assert client.list_projects() == [{"name": "b"}, {"name": "a"}]
+    assert len(session.calls) == 1
+
+
+def test_listing_cache_is_bounded(fake_session: Any) -> None:
+    client, session = fake_session(_listing, cache_ttl=60)
+    for i in range(_TTL_CACHE_MAX + 10):
+        client.list_repositories(project=f"P{i}")
+    assert len(client._ttl_cache) == _TTL_CACHE_MAX
+    # Oldest entries were evicted, newest kept
+    client.list_repositories(project=f"P{_TTL_CACHE_MAX + 9}")
+    assert len(session.calls) == _TTL_CACHE_MAX + 10
@@ -0,0 +1,70 @@
+"""Wiki page version tracking in AzureDevOpsClient.update_wiki_page (If-Match eTags)."""
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from azure_devops_mcp.ado_client import AzureDevOpsError
+
+
+class _WikiServer:
+    """One wiki page whose eTag changes on every write; optionally answers HEAD without an ETag."""
+
+    def __init__(self, etag: str = '"v1"', head_etag: bool = True):
+        self.etag = etag
+        self.head_etag = head_etag
+        self.writes = 0
+
+    def __call__(self, method: str, url: str, params: Dict[str, Any], headers: Dict[str, str]) -> Any:
+        if method == "HEAD":
+            return 200, b"", {"ETag": self.etag} if self.head_etag else {}
+        if method == "PUT":
+            if headers.get("If-Match") != self.etag:
+                return 412, {"message": "version mismatch"}, {}
+            self.writes += 1
+            self.etag = f'"v{self.writes + 1}"'
+        return 200, {"path": params["path"], "content": "x"}, {"ETag": self.etag}
+
+
+def _trace(session: Any) -> List[tuple]:
+    return [(method, headers.get("If-Match")) for method, _url, _params, headers in session.calls]
+
+
+def _update(client: Any, version: Optional[str] = None) -> Dict[str, Any]:
+    return client.update_wiki_page("Wiki", "/Page", "new", project="Project", version=version)
+
+
+def test_cold_cache_looks_up_version_with_head(fake_session: Any) -> None:
+    client, session = fake_session(_WikiServer())
+    _update(client)
+    assert _trace(session) == [("HEAD", None), ("PUT", '"v1"')]
+
+
+def test_version_from_last_write_is_reused(fake_session: Any) -> None:
+    client, session = fake_session(_WikiServer())
+    _update(client)
+    _update(client)
+    assert _trace(session) == [("HEAD", None), ("PUT", '"v1"'), ("PUT", '"v2"')]
+
+
+def test_stale_cached_version_is_refreshed_once(fake_session: Any) -> None:
+    server = _WikiServer()
+    client, session = fake_session(server)
+    client.get_wiki_page("Wiki", "/Page", project="Project")
+    server.etag = '"edited-elsewhere"'
+    _update(client)
+    assert _trace(session) == [("GET", None), ("PUT", '"v1"'), ("HEAD", None), ("PUT", '"edited-elsewhere"')]
+
+
+def test_head_without_etag_falls_back_to_get(fake_session: Any) -> None:
+    client, session = fake_session(_WikiServer(head_etag=False))
+    _update(client)
+    assert _trace(session) == [("HEAD", None), ("GET", None), ("PUT", '"v1"')]
+
+
+def test_explicit_version_conflict_is_not_retried(fake_session: Any) -> None:
+    client, session = fake_session(_WikiServer())
+    with pytest.raises(AzureDevOpsError) as exc:
+        _update(client, version='"old"')
+    assert exc.value.status_code == 412
+    assert _trace(session) == [("PUT", '"old"')]
@@ -0,0 +1,72 @@
+"""wit/$batch handling in AzureDevOpsClient: partial failures must not hide applied entries."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from azure_devops_mcp.ado_client import _WIT_BATCH_MAX, AzureDevOpsBatchError, AzureDevOpsClient, AzureDevOpsError
+from azure_devops_mcp.config import AzureDevOpsConfig
+
+
+def _client_with_batch_responses(
+    cfg: AzureDevOpsConfig, failing: Dict[int, int], rejected_chunks: frozenset = frozenset()
+) -> Any:
+    """Client whose $batch POST echoes each entry's index, failing the given indices with the given codes."""
+    client = AzureDevOpsClient(cfg)
+    sent: List[int] = []
+
+    def post(url: str, json: Any, **kwargs: Any) -> Dict[str, Any]:
+        chunk_no = len(sent)
+        sent.append(len(json))
+        if chunk_no in rejected_chunks:
+            raise AzureDevOpsError("POST $batch failed: 503 unavailable", status_code=503)
+        start = chunk_no * _WIT_BATCH_MAX
+        value = []
+        for i in range(start, start + len(json)):
+            code = failing.get(i, 200)
+            value.append({"code": code, "body": '{"id": %d}' % i if code < 400 else '{"message": "bad"}'})
+        return {"count": len(value), "value": value}
+
+    client._post = post
+    client.sent = sent
+    return client
+
+
+def test_all_chunks_sent_and_failures_reported(cfg: AzureDevOpsConfig) -> None:
+    client = _client_with_batch_responses(cfg, {3: 400})
+    updates = [(i, [{"op": "add", "path": "/fields/System.Title", "value": "t"}]) for i in range(_WIT_BATCH_MAX + 5)]
+    with pytest.raises(AzureDevOpsBatchError) as exc:
+        client.update_work_items_many(updates)
+    err = exc.value
+    assert client.sent == [_WIT_BATCH_MAX, 5]
+    assert list(err.failures) == [3]
+    assert err.failures[3][0] == 400
+    assert err.status_code == 400
+    assert len(err.results) == _WIT_BATCH_MAX + 5
+    assert err.results[3] is None
+    assert err.results[_WIT_BATCH_MAX + 4] == {"id": _WIT_BATCH_MAX + 4}
+
+
+def test_rejected_chunk_marks_its_entries_failed(cfg: AzureDevOpsConfig) -> None:
+    client = _client_with_batch_responses(cfg, {}, rejected_chunks=frozenset({0}))
+    with pytest.raises(AzureDevOpsBatchError) as exc:
+        client.create_work_items_bulk("Project", "Task", [{"System.Title": str(i)} for i in range(_WIT_BATCH_MAX + 1)])
+    err = exc.value
+    assert len(err.failures) == _WIT_BATCH_MAX
+    assert err.results[_WIT_BATCH_MAX] == {"id": _WIT_BATCH_MAX}
+
+
+def test_success_returns_bodies_in_order(cfg: AzureDevOpsConfig) -> None:
+    client = _client_with_batch_responses(cfg, {})
+    assert client.link_work_items_many([(1, 2, "System.LinkTypes.Related"), (3, 4, "System.LinkTypes.Related")]) == [
+        {"id": 0},
+        {"id": 1},
+    ]
+
+
+def test_bulk_create_encodes_work_item_type(cfg: AzureDevOpsConfig) -> None:
+    client = AzureDevOpsClient(cfg)
+    sent: List[Any] = []
+    client._post = lambda url, json, **kwargs: sent.extend(json) or {"value": [{"code": 200, "body": "{}"}]}
+    client.create_work_items_bulk("My Project", "Test Case", [{"System.Title": "t"}])
+    assert sent[0]["uri"] == "/My%20Project/_apis/wit/workitems/$Test%20Case?api-version=7.0"